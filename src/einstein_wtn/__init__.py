@@ -15,7 +15,6 @@ from .engine import (
     winner,
 )
 from .agents import Agent, ExpectiminimaxAgent, HeuristicAgent, OpeningExpectiAgent, RandomAgent, SearchStats
-from .opening import LayoutSearchAgent, generate_all_layouts, score_layout
 
 __all__ = [
     "Agent",
@@ -42,3 +41,14 @@ __all__ = [
     "new_game",
     "winner",
 ]
+
+# The opening search module is only needed for layout search; load it on first use.
+_OPENING_EXPORTS = {"LayoutSearchAgent", "generate_all_layouts", "score_layout"}
+
+
+def __getattr__(name: str):
+    if name in _OPENING_EXPORTS:
+        from . import opening
+
+        return getattr(opening, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
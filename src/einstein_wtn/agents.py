@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import itertools
 import random
 import time
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from enum import Enum
 from typing import List, Optional, TYPE_CHECKING
@@ -39,9 +41,63 @@ class SearchStats:
     elapsed_ms: float
 
 
+def _side_features(positions, target, step_masks) -> tuple[float, List[int], int, int]:
+    """Return material, goal distances, occupied-cell mask and reach mask for one side."""
+
+    material = 0.0
+    dists: List[int] = []
+    occupied = 0
+    reach = 0
+    tr, tc = target
+    for pid, coord in positions.items():
+        if coord is None:
+            continue
+        r, c = coord
+        idx = engine.cell_index(r, c)
+        material += 2 + pid * 0.5
+        dists.append(abs(tr - r) + abs(tc - c))
+        occupied |= 1 << idx
+        reach |= step_masks[idx]
+    return material, dists, occupied, reach
+
+
+def _red_position_score(state) -> float:
+    """Heuristic score from Red's perspective (higher favors Red).
+
+    Reachability is tracked as 25-bit cell masks so the threat term is a popcount
+    instead of building coordinate sets.
+    """
+
+    red_material, red_dists, red_cells, red_reach = _side_features(
+        state.pos_red, engine.TARGET_RED, engine.STEP_MASKS_RED
+    )
+    blue_material, blue_dists, blue_cells, blue_reach = _side_features(
+        state.pos_blue, engine.TARGET_BLUE, engine.STEP_MASKS_BLUE
+    )
+
+    # A) Material: weight higher ids slightly to value surviving power.
+    score = red_material - blue_material
+
+    # B) Distance: emphasize the two closest runners to stabilize signal.
+    red_dists.sort()
+    blue_dists.sort()
+    for d in red_dists[:2]:
+        score += max(0, 6 - d)
+    for d in blue_dists[:2]:
+        score -= max(0, 6 - d)
+
+    # C) Threat/safety: pieces standing on squares the opponent can reach next turn.
+    score -= 1.5 * (red_cells & blue_reach).bit_count()
+    score += 1.5 * (blue_cells & red_reach).bit_count()
+    return score
+
+
 class Agent:
     """Base class for agents."""
 
+    # True when choose_move leaves a SearchStats in ``last_stats``.
+    SUPPORTS_SEARCH_STATS = False
+
     def choose_move(self, state, dice: int, time_budget_ms: Optional[int] = None) -> Move:  # noqa: D401
         """Return a move for the given state and dice."""
 
@@ -136,6 +192,8 @@ class HeuristicAgent(Agent):
 class ExpectiminimaxAgent(Agent):
     """Agent using expectiminimax with iterative deepening over dice chance nodes."""
 
+    SUPPORTS_SEARCH_STATS = True
+
     class NodeType(str, Enum):
         """Transposition table node kinds."""
 
@@ -154,8 +212,18 @@ class ExpectiminimaxAgent(Agent):
         bound: "ExpectiminimaxAgent.Bound"
         best_move_sig: Optional[str] = None
 
-    def __init__(self, max_depth: int = 3, seed: Optional[int] = None):
+    def __init__(
+        self,
+        max_depth: int = 3,
+        seed: Optional[int] = None,
+        tt_max_entries: int = 100_000,
+        parallel_root: int = 0,
+    ):
         self.max_depth = max_depth
+        self.tt_max_entries = tt_max_entries
+        self.parallel_root = parallel_root
+        self._seed = seed
+        self._root_pool: Optional[ProcessPoolExecutor] = None
         self._heuristic = HeuristicAgent(seed=seed)
         self._rng = random.Random(seed)
         self._ttable: dict[tuple, "ExpectiminimaxAgent.TTEntry"] = {}
@@ -235,28 +303,31 @@ class ExpectiminimaxAgent(Agent):
             return fallback
         deadline = None if time_budget_ms is None else time.monotonic() + (time_budget_ms / 1000.0)
         best_move = fallback
-        self._ttable = {}
+        self._trim_tt()
 
-        for depth in range(1, self.max_depth + 1):
-            try:
-                value, move = self._search_decision(
-                    state,
-                    dice,
-                    depth,
-                    maximizing_player=state.turn,
-                    deadline=deadline,
-                    ply=0,
-                    alpha=float("-inf"),
-                    beta=float("inf"),
-                )
-                self._depth_reached = max(self._depth_reached, depth)
-            except TimeoutError:
-                break
-            if move is not None:
-                best_move = move
-            # If we already found a forced win, stop early.
-            if value == float("inf"):
-                break
+        if self.parallel_root > 1 and len(moves) > 1:
+            best_move = self._choose_root_parallel(state, moves, deadline) or fallback
+        else:
+            for depth in range(1, self.max_depth + 1):
+                try:
+                    value, move = self._search_decision(
+                        state,
+                        dice,
+                        depth,
+                        maximizing_player=state.turn,
+                        deadline=deadline,
+                        ply=0,
+                        alpha=float("-inf"),
+                        beta=float("inf"),
+                    )
+                    self._depth_reached = max(self._depth_reached, depth)
+                except TimeoutError:
+                    break
+                if move is not None:
+                    best_move = move
+                # If we already found a forced win, stop early.
+                if value == float("inf"):
+                    break
 
         elapsed_ms = (time.monotonic() - start_time) * 1000.0
         self.last_stats = SearchStats(
@@ -281,6 +352,91 @@ class ExpectiminimaxAgent(Agent):
         )
         return best_move
 
+    def _choose_root_parallel(self, state, moves: List[Move], deadline: Optional[float]) -> Optional[Move]:
+        """Search each root move in a worker process; pick the best at the deepest shared depth.
+
+        Workers keep their own transposition tables between calls; nothing is shared.
+        """
+
+        if self._root_pool is None:
+            self._root_pool = ProcessPoolExecutor(
+                max_workers=self.parallel_root,
+                initializer=_init_root_worker,
+                initargs=(self.max_depth, self._seed, self.tt_max_entries),
+            )
+        # The deadline is absolute (time.monotonic() is system-wide), so moves queued behind busy
+        # workers share the one budget instead of each starting a fresh one.
+        count = len(moves)
+        results = list(self._root_pool.map(_search_root_move, [state] * count, moves, [deadline] * count))
+
+        completed = []
+        for move, (values, nodes, tt_hits, tt_stores) in zip(moves, results):
+            self._nodes += nodes
+            self._tt_hits += tt_hits
+            self._tt_stores += tt_stores
+            # Moves that did not finish even depth 1 have no value to compare; leave them out.
+            if values:
+                # A forced win is final at every deeper iteration too.
+                reached = self.max_depth if values[-1] == float("inf") else len(values)
+                completed.append((move, values, reached))
+        if not completed:
+            return None
+        shared_depth = min(reached for _, _, reached in completed)
+        self._depth_reached = shared_depth
+        best_move = None
+        best_value = float("-inf")
+        for move, values, _ in completed:
+            value = values[min(shared_depth, len(values)) - 1]
+            if best_move is None or value > best_value:
+                best_move, best_value = move, value
+        return best_move
+
+    def _search_root_move(self, state, move: Move, deadline: Optional[float]) -> tuple[List[float], int, int, int]:
+        """Iteratively deepen below one root move; return the value reached at each depth."""
+
+        self._nodes = self._tt_hits = self._tt_stores = 0
+        self._trim_tt()
+        maximizing_player = state.turn
+        child = engine.apply_move(state, move)
+        values: List[float] = []
+        for depth in range(1, self.max_depth + 1):
+            try:
+                value = self._search_chance(
+                    child, depth - 1, maximizing_player, deadline, 1, float("-inf"), float("inf")
+                )
+            except TimeoutError:
+                break
+            values.append(value)
+            if value == float("inf"):
+                break
+        return values, self._nodes, self._tt_hits, self._tt_stores
+
+    def close_root_pool(self) -> None:
+        """Shut down the root-parallel worker pool, if one was started."""
+
+        if self._root_pool is not None:
+            self._root_pool.shutdown()
+            self._root_pool = None
+
+    def __getstate__(self) -> dict:
+        # Worker pools cannot be pickled; a copy starts its own on first use.
+        state = self.__dict__.copy()
+        state["_root_pool"] = None
+        return state
+
+    def reset_tt(self) -> None:
+        """Drop all transposition entries (they otherwise persist across moves and games)."""
+
+        self._ttable = {}
+
+    def _trim_tt(self) -> None:
+        """Evict the oldest entries (dict insertion order) once the table exceeds its cap."""
+
+        excess = len(self._ttable) - self.tt_max_entries
+        if excess > 0:
+            for key in list(itertools.islice(self._ttable, excess)):
+                del self._ttable[key]
+
     def _decay_memory(self) -> None:
         """Gently decay history scores and prune stale killer depths between moves."""
 
@@ -312,61 +468,9 @@ class ExpectiminimaxAgent(Agent):
         if victor is maximizing_player.opponent():
             return float("-inf")
 
-        score_red = self._red_score(state)
+        score_red = _red_position_score(state)
         return score_red if maximizing_player is Player.RED else -score_red
 
-    def _red_score(self, state) -> float:
-        """Heuristic score from Red's perspective (higher favors Red)."""
-
-        score = 0.0
-
-        # A) Material: weight higher ids slightly to value surviving power.
-        for pid, coord in state.pos_red.items():
-            if coord is not None:
-                score += 2 + pid * 0.5
-        for pid, coord in state.pos_blue.items():
-            if coord is not None:
-                score -= 2 + pid * 0.5
-
-        # B) Distance: emphasize the two closest runners to stabilize signal.
-        def dist(player: Player, coord) -> int:
-            target = engine.TARGET_RED if player is Player.RED else engine.TARGET_BLUE
-            return abs(target[0] - coord[0]) + abs(target[1] - coord[1])
-
-        red_dists = sorted([dist(Player.RED, coord) for coord in state.pos_red.values() if coord is not None])
-        blue_dists = sorted([dist(Player.BLUE, coord) for coord in state.pos_blue.values() if coord is not None])
-        for d in red_dists[:2]:
-            score += max(0, 6 - d)
-        for d in blue_dists[:2]:
-            score -= max(0, 6 - d)
-
-        # C) Threat/safety: squares an opponent can reach next turn.
-        def reachable_squares(player: Player):
-            dirs = engine.DIRECTIONS_RED if player is Player.RED else engine.DIRECTIONS_BLUE
-            positions = state.pos_red if player is Player.RED else state.pos_blue
-            squares = set()
-            for coord in positions.values():
-                if coord is None:
-                    continue
-                r, c = coord
-                for dr, dc in dirs:
-                    nr, nc = r + dr, c + dc
-                    if 0 <= nr < engine.BOARD_SIZE and 0 <= nc < engine.BOARD_SIZE:
-                        squares.add((nr, nc))
-            return squares
-
-        red_reach = reachable_squares(Player.RED)
-        blue_reach = reachable_squares(Player.BLUE)
-
-        for coord in state.pos_red.values():
-            if coord is not None and coord in blue_reach:
-                score -= 1.5
-        for coord in state.pos_blue.values():
-            if coord is not None and coord in red_reach:
-                score += 1.5
-
-        return score
-
     def _move_signature(self, move: Move) -> str:
         """Return a stable string signature for a move."""
 
@@ -649,7 +753,10 @@ class ExpectiminimaxAgent(Agent):
             )
             total += val
         avg = total / 6.0
-        self._store_tt_entry(key, avg, depth, self.Bound.EXACT, None)
+        # Children searched inside a narrowed window return bounds, and their average is not a
+        # bound of either kind. Entries outlive the search, so only full-window averages go in.
+        if alpha == float("-inf") and beta == float("inf"):
+            self._store_tt_entry(key, avg, depth, self.Bound.EXACT, None)
         return avg
 
     def _store_tt_entry(
@@ -669,9 +776,23 @@ class ExpectiminimaxAgent(Agent):
             self._tt_bestmove_stores += 1
 
 
+_ROOT_WORKER: Optional[ExpectiminimaxAgent] = None
+
+
+def _init_root_worker(max_depth: int, seed: Optional[int], tt_max_entries: int) -> None:
+    global _ROOT_WORKER
+    _ROOT_WORKER = ExpectiminimaxAgent(max_depth=max_depth, seed=seed, tt_max_entries=tt_max_entries)
+
+
+def _search_root_move(state, move: Move, deadline: Optional[float]) -> tuple[List[float], int, int, int]:
+    return _ROOT_WORKER._search_root_move(state, move, deadline)
+
+
 class OpeningExpectiAgent(Agent):
     """Hybrid agent: layout search for openings, expectiminimax for moves."""
 
+    SUPPORTS_SEARCH_STATS = True
+
     def __init__(
         self,
         seed: Optional[int] = None,
@@ -690,6 +811,12 @@ class OpeningExpectiAgent(Agent):
         budget = self.layout_budget_ms if time_budget_ms is None else time_budget_ms
         return self.opening.choose_initial_layout(player, time_budget_ms=budget)
 
+    def reset_tt(self) -> None:
+        self.move_agent.reset_tt()
+
+    def close_root_pool(self) -> None:
+        self.move_agent.close_root_pool()
+
     def choose_move(self, state, dice: int, time_budget_ms: Optional[int] = None) -> Move:
         move = self.move_agent.choose_move(state, dice, time_budget_ms=time_budget_ms)
         self.last_stats = self.move_agent.last_stats
@@ -14,7 +14,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Iterable, List, Sequence, Tuple
 
-from .types import GameState, Move, Player
+from .types import ZOBRIST_BLUE_TURN, ZOBRIST_CELL, GameState, Move, Player
 
 BOARD_SIZE = 5
 START_RED_CELLS: Tuple[Tuple[int, int], ...] = (
@@ -39,6 +39,49 @@ DIRECTIONS_RED: Tuple[Tuple[int, int], ...] = ((0, 1), (1, 0), (1, 1))
 DIRECTIONS_BLUE: Tuple[Tuple[int, int], ...] = ((0, -1), (-1, 0), (-1, -1))
 
 
+def cell_index(r: int, c: int) -> int:
+    """Return the bit index (``r * BOARD_SIZE + c``) of a cell in 25-bit board masks."""
+
+    return r * BOARD_SIZE + c
+
+
+def _step_masks(directions: Tuple[Tuple[int, int], ...]) -> Tuple[int, ...]:
+    masks: List[int] = []
+    for r in range(BOARD_SIZE):
+        for c in range(BOARD_SIZE):
+            mask = 0
+            for dr, dc in directions:
+                nr, nc = r + dr, c + dc
+                if 0 <= nr < BOARD_SIZE and 0 <= nc < BOARD_SIZE:
+                    mask |= 1 << cell_index(nr, nc)
+            masks.append(mask)
+    return tuple(masks)
+
+
+# Per-cell bitmasks of the squares a piece can step onto next turn, indexed by cell_index.
+STEP_MASKS_RED: Tuple[int, ...] = _step_masks(DIRECTIONS_RED)
+STEP_MASKS_BLUE: Tuple[int, ...] = _step_masks(DIRECTIONS_BLUE)
+
+# One shared coordinate tuple per cell, and per cell the on-board step destinations in
+# direction order, so move generation neither bounds-checks nor allocates coordinates.
+_CELL_COORDS: Tuple[Tuple[int, int], ...] = tuple((r, c) for r in range(BOARD_SIZE) for c in range(BOARD_SIZE))
+
+
+def _step_targets(directions: Tuple[Tuple[int, int], ...]) -> Tuple[Tuple[Tuple[int, int], ...], ...]:
+    return tuple(
+        tuple(
+            _CELL_COORDS[cell_index(r + dr, c + dc)]
+            for dr, dc in directions
+            if 0 <= r + dr < BOARD_SIZE and 0 <= c + dc < BOARD_SIZE
+        )
+        for r, c in _CELL_COORDS
+    )
+
+
+STEP_TARGETS_RED = _step_targets(DIRECTIONS_RED)
+STEP_TARGETS_BLUE = _step_targets(DIRECTIONS_BLUE)
+
+
 def _bit_for(piece_id: int) -> int:
     return 1 << (piece_id - 1)
 
@@ -122,10 +165,6 @@ def get_movable_piece_ids(state: GameState, player: Player, dice: int) -> List[i
     return candidates
 
 
-def _directions_for(player: Player) -> Tuple[Tuple[int, int], ...]:
-    return DIRECTIONS_RED if player is Player.RED else DIRECTIONS_BLUE
-
-
 def _pos_for(state: GameState, player: Player):
     return state.pos_red if player is Player.RED else state.pos_blue
 
@@ -141,15 +180,13 @@ def generate_legal_moves(state: GameState, dice: int) -> List[Move]:
     candidates = get_movable_piece_ids(state, player, dice)
     moves: List[Move] = []
     positions = _pos_for(state, player)
+    targets = STEP_TARGETS_RED if player is Player.RED else STEP_TARGETS_BLUE
     for pid in sorted(candidates):
         current = positions.get(pid)
         if current is None:
             continue
-        r, c = current
-        for dr, dc in _directions_for(player):
-            nr, nc = r + dr, c + dc
-            if 0 <= nr < BOARD_SIZE and 0 <= nc < BOARD_SIZE:
-                moves.append(Move(piece_id=pid, from_rc=current, to_rc=(nr, nc)))
+        for to_rc in targets[current[0] * BOARD_SIZE + current[1]]:
+            moves.append(Move(pid, current, to_rc))
     return moves
 
 
@@ -167,7 +204,19 @@ def _capture(state: GameState, coord: Tuple[int, int]) -> None:
         state.pos_blue[piece_id] = None
         state.alive_blue &= ~_bit_for(piece_id)
     state.board[r][c] = 0
-    state._key_cache = None
+
+
+def _zobrist_after(h: int, mover: int, target: int, from_r: int, from_c: int, to_r: int, to_c: int) -> int:
+    """Update a Zobrist hash for ``mover`` stepping onto a cell holding ``target``."""
+
+    to_keys = ZOBRIST_CELL[to_r * BOARD_SIZE + to_c]
+    return (
+        h
+        ^ ZOBRIST_CELL[from_r * BOARD_SIZE + from_c][mover + 6]
+        ^ to_keys[target + 6]
+        ^ to_keys[mover + 6]
+        ^ ZOBRIST_BLUE_TURN
+    )
 
 
 def apply_move(state: GameState, move: Move) -> GameState:
@@ -177,6 +226,10 @@ def apply_move(state: GameState, move: Move) -> GameState:
     next_state = state.clone()
     r_from, c_from = move.from_rc
     r_to, c_to = move.to_rc
+    if next_state._zobrist is not None:
+        next_state._zobrist = _zobrist_after(
+            next_state._zobrist, state.board[r_from][c_from], state.board[r_to][c_to], r_from, c_from, r_to, c_to
+        )
 
     # Remove moving piece from origin.
     next_state.board[r_from][c_from] = 0
@@ -192,7 +245,6 @@ def apply_move(state: GameState, move: Move) -> GameState:
     next_state.board[r_to][c_to] = sign
 
     next_state.turn = player.opponent()
-    next_state._key_cache = None
     return next_state
 
 
@@ -210,7 +262,7 @@ class UndoRecord:
     captured_prev_pos: Tuple[int, int] | None
     alive_red: int
     alive_blue: int
-    key_cache: Tuple | None
+    zobrist: int | None
 
 
 def apply_move_inplace(state: GameState, move: Move) -> UndoRecord:
@@ -246,8 +298,9 @@ def apply_move_inplace(state: GameState, move: Move) -> UndoRecord:
     state.board[from_r][from_c] = 0
     state.board[to_r][to_c] = from_value
     state.turn = player.opponent()
-    prev_key = state._key_cache
-    state._key_cache = None
+    prev_zobrist = state._zobrist
+    if prev_zobrist is not None:
+        state._zobrist = _zobrist_after(prev_zobrist, from_value, to_value, from_r, from_c, to_r, to_c)
 
     return UndoRecord(
         prev_turn=player,
@@ -260,7 +313,7 @@ def apply_move_inplace(state: GameState, move: Move) -> UndoRecord:
         captured_prev_pos=captured_prev_pos,
         alive_red=alive_red_prev,
         alive_blue=alive_blue_prev,
-        key_cache=prev_key,
+        zobrist=prev_zobrist,
     )
 
 
@@ -287,7 +340,7 @@ def undo_move_inplace(state: GameState, undo: UndoRecord) -> None:
     state.board[from_r][from_c] = undo.from_value
     state.board[to_r][to_c] = undo.to_value
 
-    state._key_cache = undo.key_cache
+    state._zobrist = undo.zobrist
 
 
 def winner(state: GameState) -> Player | None:
@@ -39,6 +39,7 @@ class GameController:
         self.state: GameState
         self.dice: Optional[int] = None
         self.history: List[Tuple[int, Move]]
+        self._wtn_moves: List[Tuple[int, int, str, int, int, int]]
         self.new_game(red_layout=red_layout, blue_layout=blue_layout, first=first)
 
     def new_game(
@@ -68,6 +69,7 @@ class GameController:
             self.red_layout_coords, self.blue_layout_coords, first=self._initial_turn
         )
         self.history = []
+        self._wtn_moves = []
         self.dice = None
 
     def _select_order(self, provided: Optional[Sequence[int]], agent, default_order: Sequence[int]) -> List[int]:
@@ -163,6 +165,7 @@ class GameController:
             self.red_layout_coords, self.blue_layout_coords, first=self._initial_turn
         )
         self.history = []
+        self._wtn_moves = []
         self.dice = None
 
     def set_dice(self, value: int) -> None:
@@ -224,6 +227,10 @@ class GameController:
         if self.dice is None:
             raise ValueError("dice not set")
         self.history.append((self.dice, move))
+        # Serialize alongside history so to_wtn does not replay the turn order.
+        color = "R" if self.state.turn is Player.RED else "B"
+        to_r, to_c = move.to_rc
+        self._wtn_moves.append((len(self.history), self.dice, color, move.piece_id, to_r, to_c))
         self.state = applied
         self.dice = None
         return applied
@@ -257,13 +264,6 @@ class GameController:
 
         red_layout_dict = {pid: coord for pid, coord in enumerate(self.red_layout_coords, start=1)}
         blue_layout_dict = {pid: coord for pid, coord in enumerate(self.blue_layout_coords, start=1)}
-        moves_payload = []
-        turn = self._initial_turn
-        for idx, (dice, move) in enumerate(self.history, start=1):
-            color = "R" if turn is Player.RED else "B"
-            to_r, to_c = move.to_rc
-            moves_payload.append((idx, dice, color, move.piece_id, to_r, to_c))
-            turn = turn.opponent()
         comments = [
             f"# red_agent={self.red_agent.__class__.__name__ if self.red_agent else 'Human'}",
             f"# blue_agent={self.blue_agent.__class__.__name__ if self.blue_agent else 'Human'}",
@@ -272,7 +272,7 @@ class GameController:
             comments=comments,
             red_layout=red_layout_dict,
             blue_layout=blue_layout_dict,
-            moves=moves_payload,
+            moves=list(self._wtn_moves),
         )
         return dump_wtn(game)
 
@@ -254,12 +254,12 @@ _LANG_MAP: Dict[str, Dict[str, str]] = {"zh": LANG_ZH, "en": LANG_EN}
 def t(key: str, lang: str) -> str:
     """Translate a key for the provided language or raise when missing."""
 
-    if lang not in _LANG_MAP:
-        raise ValueError(f"Unsupported language '{lang}'")
-    table = _LANG_MAP[lang]
-    if key not in table:
-        raise ValueError(f"Missing translation for key '{key}'")
-    return table[key]
+    try:
+        return _LANG_MAP[lang][key]
+    except KeyError:
+        if lang not in _LANG_MAP:
+            raise ValueError(f"Unsupported language '{lang}'") from None
+        raise ValueError(f"Missing translation for key '{key}'") from None
 
 
 def available_langs() -> List[str]:
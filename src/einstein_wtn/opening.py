@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+import functools
+import heapq
 import itertools
 import random
 import time
-from typing import Dict, Iterable, List, Sequence
+from typing import Dict, Iterable, List, Sequence, Tuple
 
 from . import engine
 from .agents import ExpectiminimaxAgent, HeuristicAgent
@@ -18,73 +20,47 @@ def generate_all_layouts() -> Iterable[List[int]]:
     return itertools.permutations([1, 2, 3, 4, 5, 6])
 
 
-def _static_layout_score(layout: Sequence[int], player: Player) -> float:
-    """Fast heuristic score for a layout from the given player's perspective."""
+@functools.lru_cache(maxsize=None)
+def _static_cell_weights(player: Player) -> Tuple[int, ...]:
+    """Per start cell weight ``2 - distance_to_target`` used by the static score."""
 
     cells = engine.START_RED_CELLS if player is Player.RED else engine.START_BLUE_CELLS
     target = engine.TARGET_RED if player is Player.RED else engine.TARGET_BLUE
-    score = 0.0
-    for pid, cell in zip(layout, cells):
-        # Prefer higher ids closer to target.
-        dist = abs(target[0] - cell[0]) + abs(target[1] - cell[1])
-        score += pid * 2 - dist
-    return score
-
-
-def _red_position_score(state) -> float:
-    """Red-centric positional heuristic mirrored from expectiminimax."""
-
-    score = 0.0
-    for pid, coord in state.pos_red.items():
-        if coord is not None:
-            score += 2 + pid * 0.5
-    for pid, coord in state.pos_blue.items():
-        if coord is not None:
-            score -= 2 + pid * 0.5
-
-    def dist(player: Player, coord) -> int:
-        target = engine.TARGET_RED if player is Player.RED else engine.TARGET_BLUE
-        return abs(target[0] - coord[0]) + abs(target[1] - coord[1])
-
-    red_dists = sorted([dist(Player.RED, coord) for coord in state.pos_red.values() if coord is not None])
-    blue_dists = sorted([dist(Player.BLUE, coord) for coord in state.pos_blue.values() if coord is not None])
-    for d in red_dists[:2]:
-        score += max(0, 6 - d)
-    for d in blue_dists[:2]:
-        score -= max(0, 6 - d)
-
-    def reachable_squares(player: Player):
-        dirs = engine.DIRECTIONS_RED if player is Player.RED else engine.DIRECTIONS_BLUE
-        positions = state.pos_red if player is Player.RED else state.pos_blue
-        squares = set()
-        for coord in positions.values():
-            if coord is None:
-                continue
-            r, c = coord
-            for dr, dc in dirs:
-                nr, nc = r + dr, c + dc
-                if 0 <= nr < engine.BOARD_SIZE and 0 <= nc < engine.BOARD_SIZE:
-                    squares.add((nr, nc))
-        return squares
+    return tuple(2 - (abs(target[0] - r) + abs(target[1] - c)) for r, c in cells)
+
+
+def _static_layout_score(layout: Sequence[int], player: Player) -> float:
+    """Fast heuristic score for a layout from the given player's perspective."""
 
-    red_reach = reachable_squares(Player.RED)
-    blue_reach = reachable_squares(Player.BLUE)
+    # Prefer higher ids closer to target: distance is weighted by the piece id so the
+    # score actually depends on the permutation (sum(pid) is the same for every layout).
+    return float(sum(pid * weight for pid, weight in zip(layout, _static_cell_weights(player))))
 
-    for coord in state.pos_red.values():
-        if coord is not None and coord in blue_reach:
-            score -= 1.5
-    for coord in state.pos_blue.values():
-        if coord is not None and coord in red_reach:
-            score += 1.5
 
-    return score
+@functools.lru_cache(maxsize=None)
+def _static_layout_table(player: Player) -> Tuple[Tuple[float, Tuple[int, ...]], ...]:
+    """Static scores for all 720 layouts, in ``generate_all_layouts`` order."""
 
+    return tuple((_static_layout_score(layout, player), layout) for layout in generate_all_layouts())
 
-def _arrangement_to_layout(order: Sequence[int], start_cells: Sequence[tuple[int, int]]) -> List[tuple[int, int]]:
-    layout: List[tuple[int, int]] = [None] * 6  # type: ignore[list-item]
+
+@functools.lru_cache(maxsize=None)
+def _cached_layout(order: Tuple[int, ...], start_cells: Tuple[Tuple[int, int], ...]) -> Tuple[Tuple[int, int], ...]:
+    layout: List[Tuple[int, int]] = [None] * 6  # type: ignore[list-item]
     for idx, piece_id in enumerate(order):
         layout[piece_id - 1] = start_cells[idx]
-    return layout  # type: ignore[return-value]
+    return tuple(layout)
+
+
+def _arrangement_to_layout(
+    order: Sequence[int], start_cells: Sequence[Tuple[int, int]]
+) -> Tuple[Tuple[int, int], ...]:
+    """Map a start-cell ordering to per-piece coordinates.
+
+    There are only 720 orderings per side, so results are memoized across calls.
+    """
+
+    return _cached_layout(tuple(order), tuple(start_cells))
 
 
 def score_layout(
@@ -134,24 +110,29 @@ def score_layout(
         )
 
         for seq in dice_sequences[:seqs_to_use]:
-            sim_state = state.clone()
+            # Play the sequence in place on the shared start state, then take the moves back.
+            undo_stack = []
+            victor = None
             for dice in seq:
-                mover = sim_state.turn
+                mover = state.turn
                 if mover is player:
-                    mv = expecti.choose_move(sim_state, dice, time_budget_ms=8)
+                    mv = expecti.choose_move(state, dice, time_budget_ms=8)
                 else:
-                    mv = opponent_agent.choose_move(sim_state, dice, time_budget_ms=4)
-                sim_state = engine.apply_move(sim_state, mv)
-                if engine.is_terminal(sim_state):
+                    mv = opponent_agent.choose_move(state, dice, time_budget_ms=4)
+                undo_stack.append(engine.apply_move_inplace(state, mv))
+                # winner() reads the two goal corners and alive masks; reuse its result below.
+                victor = engine.winner(state)
+                if victor is not None:
                     break
-            victor = engine.winner(sim_state)
             if victor is player:
                 scores.append(float("inf"))
             elif victor is player.opponent():
                 scores.append(float("-inf"))
             else:
-                val = expecti._evaluate(sim_state, player)  # type: ignore[attr-defined]
+                val = expecti._evaluate(state, player)  # type: ignore[attr-defined]
                 scores.append(val)
+            while undo_stack:
+                engine.undo_move_inplace(state, undo_stack.pop())
         if budget_ms is not None and (time.monotonic() - start) * 1000 > budget_ms:
             break
 
@@ -182,16 +163,24 @@ class LayoutSearchAgent(HeuristicAgent):
         self.layout_eval_mode = layout_eval_mode
         self.layout_eval_budget_ms = layout_eval_budget_ms
         self.last_opening_stats: Dict[str, float | int] | None = None
+        # Results and their search stats per (player, budget_ms); a match asks the same
+        # question every game.
+        self._layout_cache: Dict[Tuple[Player, int], Tuple[Tuple[int, ...], Dict[str, float | int]]] = {}
 
     def choose_initial_layout(self, player: Player, time_budget_ms: int | None = None) -> List[int]:
         budget_ms = 200 if time_budget_ms is None else time_budget_ms
+        cached = self._layout_cache.get((player, budget_ms))
+        if cached is not None:
+            layout, stats = cached
+            # Report the reuse itself: nothing was evaluated and no time was spent.
+            self.last_opening_stats = {**stats, "evaluated_candidates": 0, "elapsed_ms": 0.0, "cached": True}
+            return list(layout)
         start = time.monotonic()
         rng = random.Random(self._seed)
 
-        layouts = list(generate_all_layouts())
-        static_scored = [(_static_layout_score(layout, player) + rng.random() * 1e-6, layout) for layout in layouts]
-        static_scored.sort(key=lambda item: item[0], reverse=True)
-        candidates = [layout for _, layout in static_scored[: min(self.sample_size, len(static_scored))]]
+        static_scored = [(score + rng.random() * 1e-6, layout) for score, layout in _static_layout_table(player)]
+        top = heapq.nlargest(min(self.sample_size, len(static_scored)), static_scored, key=lambda item: item[0])
+        candidates = [layout for _, layout in top]
         baseline = [
             [1, 2, 3, 4, 5, 6],
             [6, 5, 4, 3, 2, 1],
@@ -223,10 +212,15 @@ class LayoutSearchAgent(HeuristicAgent):
         best_score = None
         best_layout = None
         refine_limit = min(3, len(finalists))
+        # Finalists are sorted by first-pass score; treat the leader's score as the
+        # optimistic refined value and skip candidates that cannot overtake the best blend.
+        upper_bound = finalists[0][0]
         for val, layout in finalists[:refine_limit]:
             elapsed_ms = (time.monotonic() - start) * 1000
             if elapsed_ms > budget_ms:
                 break
+            if best_score is not None and (val + upper_bound) / 2 <= best_score:
+                continue
             # Refine with slightly more budget if available.
             refined = score_layout(
                 layout,
@@ -239,6 +233,9 @@ class LayoutSearchAgent(HeuristicAgent):
             if best_score is None or total_score > best_score:
                 best_score = total_score
                 best_layout = layout
+            if total_score == float("inf"):
+                # A forced win cannot be improved upon.
+                break
 
         if best_layout is None:
             best_layout = finalists[0][1]
@@ -250,5 +247,7 @@ class LayoutSearchAgent(HeuristicAgent):
             "elapsed_ms": elapsed_ms,
             "best_score": best_score if best_score is not None else 0.0,
             "mode": self.layout_eval_mode,
+            "cached": False,
         }
+        self._layout_cache[(player, budget_ms)] = (tuple(best_layout), dict(self.last_opening_stats))
         return list(best_layout)
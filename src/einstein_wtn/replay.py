@@ -2,58 +2,64 @@
 from __future__ import annotations
 
 import argparse
-from typing import Dict, Iterable, List, Optional, Tuple
+from typing import Dict, FrozenSet, List, Optional, Tuple
 
 from . import engine
-from .wtn_format import WTNGame, parse_wtn, rc_to_sq
-from .types import Player
+from .wtn_format import WTNGame, format_board, parse_wtn, rc_to_sq
+from .types import Move, Player
 
 
-def _format_board(board: List[List[int]]) -> str:
-    lines: List[str] = []
-    for row in board:
-        parts: List[str] = []
-        for cell in row:
-            if cell == 0:
-                parts.append(" . ")
-            elif cell > 0:
-                parts.append(f"R{cell}")
-            else:
-                parts.append(f"B{abs(cell)}")
-        lines.append(" ".join(parts))
-    return "\n".join(lines)
+_COLOR_CHAR = {Player.RED: "R", Player.BLUE: "B"}
+
+_START_RED_SET = frozenset(engine.START_RED_CELLS)
+_START_BLUE_SET = frozenset(engine.START_BLUE_CELLS)
 
 
 def _layout_dict_to_list(
-    layout: Dict[int, Tuple[int, int]], start_cells: Iterable[Tuple[int, int]]
+    layout: Dict[int, Tuple[int, int]], start_set: FrozenSet[Tuple[int, int]]
 ) -> List[Tuple[int, int]]:
     if len(layout) != 6:
         raise ValueError("layout must contain 6 pieces")
-    layout_list: List[Optional[Tuple[int, int]]] = [None] * 6
-    for pid, coord in layout.items():
-        if not 1 <= pid <= 6:
-            raise ValueError(f"piece id out of range: {pid}")
-        layout_list[pid - 1] = coord
-    if any(item is None for item in layout_list):
-        missing = [idx + 1 for idx, item in enumerate(layout_list) if item is None]
-        raise ValueError(f"layout missing ids {missing}")
-    start_set = set(start_cells)
-    if set(layout_list) != start_set:
+    try:
+        layout_list = [layout[pid] for pid in range(1, 7)]
+    except KeyError:
+        # Six entries but not ids 1..6, so at least one id is out of range.
+        pid = next(pid for pid in layout if not 1 <= pid <= 6)
+        raise ValueError(f"piece id out of range: {pid}") from None
+    if frozenset(layout_list) != start_set:
         raise ValueError("layout coordinates must match allowed start cells")
-    return layout_list  # type: ignore[return-value]
+    return layout_list
+
+
+def _trusted_move(state: engine.GameState, player: Player, piece_id: int, to_r: int, to_c: int) -> Optional[Move]:
+    """Build a move without dice checks; ``None`` if the piece or step is impossible."""
+
+    positions = state.pos_red if player is Player.RED else state.pos_blue
+    from_rc = positions.get(piece_id)
+    if from_rc is None:
+        return None
+    steps = engine.STEP_MASKS_RED if player is Player.RED else engine.STEP_MASKS_BLUE
+    if not steps[engine.cell_index(*from_rc)] >> engine.cell_index(to_r, to_c) & 1:
+        return None
+    return Move(piece_id=piece_id, from_rc=from_rc, to_rc=(to_r, to_c))
 
 
 def replay_game(
-    game: WTNGame, verbose: bool = False
+    game: WTNGame, verbose: bool = False, validate: bool = True
 ) -> Tuple[engine.GameState, Optional[Player]]:
-    """Replay a parsed WTN game and return the final state and winner (if any)."""
+    """Replay a parsed WTN game and return the final state and winner (if any).
+
+    With ``validate=False`` the record is trusted: dice legality is not checked and
+    legal moves are not generated; each move only needs its piece on the board and a
+    destination one forward step away.
+    """
 
     first_player = Player.RED
     if game.moves:
         first_player = Player.RED if game.moves[0][2] == "R" else Player.BLUE
 
-    layout_red = _layout_dict_to_list(game.red_layout, engine.START_RED_CELLS)
-    layout_blue = _layout_dict_to_list(game.blue_layout, engine.START_BLUE_CELLS)
+    layout_red = _layout_dict_to_list(game.red_layout, _START_RED_SET)
+    layout_blue = _layout_dict_to_list(game.blue_layout, _START_BLUE_SET)
 
     state = engine.new_game(layout_red, layout_blue, first=first_player)
 
@@ -61,32 +67,36 @@ def replay_game(
         if ply != idx + 1:
             raise ValueError(f"Ply numbering mismatch at move {idx + 1}: expected {idx + 1}, got {ply}")
         player = state.turn
-        expected_color = "R" if player is Player.RED else "B"
+        expected_color = _COLOR_CHAR[player]
         if color != expected_color:
             raise ValueError(f"Turn {ply} color mismatch: expected {expected_color}, got {color}")
-        legal_moves = engine.generate_legal_moves(state, dice)
-        matching = [m for m in legal_moves if m.piece_id == piece_id and m.to_rc == (to_r, to_c)]
-        if not matching:
+        if validate:
+            legal_by_target = {(m.piece_id, m.to_rc): m for m in engine.generate_legal_moves(state, dice)}
+            move = legal_by_target.get((piece_id, (to_r, to_c)))
+        else:
+            move = _trusted_move(state, player, piece_id, to_r, to_c)
+        if move is None:
             square = rc_to_sq(to_r, to_c)
             raise ValueError(f"Illegal move at ply {ply}: {color}{piece_id} -> {square} with dice {dice}")
-        move = matching[0]
         state = engine.apply_move(state, move)
         if verbose:
             square = rc_to_sq(to_r, to_c)
             print(f"Ply {ply}: {player.name} dice={dice} move={color}{piece_id}->{square}")
-            print(_format_board(state.board))
+            print(format_board(state.board))
             print()
 
     return state, engine.winner(state)
 
 
 def replay_file(
-    path: str, verbose: bool = False
+    path: str, verbose: bool = False, bufsize: int = 1 << 20, validate: bool = True
 ) -> Tuple[engine.GameState, Optional[Player]]:
-    with open(path, "r", encoding="utf-8") as f:
-        text = f.read()
+    """Replay a WTN file, reading it in a single buffered pass of ``bufsize`` bytes."""
+
+    with open(path, "rb", buffering=bufsize) as f:
+        text = f.read().decode("utf-8")
     game = parse_wtn(text)
-    return replay_game(game, verbose=verbose)
+    return replay_game(game, verbose=verbose, validate=validate)
 
 
 def main(argv: Optional[List[str]] = None) -> None:
@@ -101,7 +111,7 @@ def main(argv: Optional[List[str]] = None) -> None:
     else:
         print("Winner: None (game not terminal)")
     print("Final board:")
-    print(_format_board(state.board))
+    print(format_board(state.board))
 
 
 if __name__ == "__main__":
@@ -8,20 +8,39 @@ Usage examples:
 from __future__ import annotations
 
 import argparse
+import functools
+import io
+import os
 import random
+import sys
 import time
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from typing import Callable, Dict, List, Optional, Sequence
 
 from . import engine
 from .agents import ExpectiminimaxAgent, HeuristicAgent, OpeningExpectiAgent, RandomAgent, SearchStats
-from .opening import LayoutSearchAgent
-from .time_manager import TimeManagerConfig, compute_move_budget_ms
+from .time_manager import TimeManagerConfig, compute_move_budget
 from .types import GameState, Player
-from .wtn_format import WTNGame, dump_wtn
+from .wtn_format import dump_layout_line, dump_move_line, format_board
 
 AgentFactory = Callable[[Optional[int]], RandomAgent]
 
+_COLOR_CHAR = {Player.RED: "R", Player.BLUE: "B"}
+
+_IDENTITY_ORDER = (1, 2, 3, 4, 5, 6)
+
+# Who moves first in each game of a best-of-7 match.
+_MATCH_FIRST_ORDER = (Player.RED, Player.BLUE, Player.BLUE, Player.RED, Player.RED, Player.BLUE, Player.BLUE)
+
+# %-template for the per-move ``--stats`` line; cheaper to fill than one long f-string.
+_EXPECTI_STATS_LINE = (
+    "%s expecti stats: depth=%s nodes=%s tt_hit_rate=%.3f tt_exact=%s tt_lower=%s tt_upper=%s "
+    "tt_cutoffs=%s tt_bestmove_hits=%s tt_bestmove_stores=%s killer_hits=%s history_hits=%s "
+    "pv_hits=%s pv_root=%s pv_dec=%s killer_size=%s history_size=%s elapsed_ms=%.2f "
+    "remaining_ms=%.1f budget_ms=%s flags=%s"
+)
+
 
 @dataclass
 class GameSummary:
@@ -31,26 +50,41 @@ class GameSummary:
     search_stats: Dict[Player, List[SearchStats]]
 
 
-def _build_agent(name: str, seed: Optional[int]):
+def _build_agent(name: str, seed: Optional[int], parallel_root: int = 0):
     if name == "random":
         return RandomAgent(seed=seed)
     if name == "heuristic":
         return HeuristicAgent(seed=seed)
     if name == "expecti":
-        return ExpectiminimaxAgent(seed=seed)
+        return ExpectiminimaxAgent(seed=seed, parallel_root=parallel_root)
     if name == "layoutsearch":
+        from .opening import LayoutSearchAgent
+
         return LayoutSearchAgent(seed=seed)
     if name in {"opening-expecti", "opening_expecti"}:
-        return OpeningExpectiAgent(seed=seed)
+        return OpeningExpectiAgent(seed=seed, move_agent_kwargs={"parallel_root": parallel_root})
     raise ValueError(f"Unknown agent '{name}'")
 
 
+def _is_piece_permutation(order: Sequence[int]) -> bool:
+    """True if ``order`` holds each piece id 1..6 exactly once (bit p set for id p)."""
+
+    if len(order) != 6:
+        return False
+    mask = 0
+    for piece_id in order:
+        if not 1 <= piece_id <= 6:
+            return False
+        mask |= 1 << piece_id
+    return mask == 0b1111110
+
+
 def parse_layout_string(raw: str) -> List[int]:
     """Parse a comma-separated permutation of piece ids 1..6."""
 
     parts = [p.strip() for p in raw.split(",") if p.strip()]
     order = [int(p) for p in parts]
-    if len(order) != 6 or sorted(order) != [1, 2, 3, 4, 5, 6]:
+    if not _is_piece_permutation(order):
         raise ValueError("Layout must list each id 1..6 exactly once")
     return order
 
@@ -58,29 +92,16 @@ def parse_layout_string(raw: str) -> List[int]:
 def arrangement_to_layout(order: Sequence[int], start_cells: Sequence[tuple[int, int]]) -> List[tuple[int, int]]:
     """Convert a start-cell ordering into layout coordinates for engine.new_game."""
 
+    if tuple(order) == _IDENTITY_ORDER:
+        # Piece k sits on the k-th start cell.
+        return list(start_cells)
+    if not _is_piece_permutation(order):
+        raise ValueError("order must list each piece id 1..6 exactly once")
+    # Validated up front, so every slot is filled exactly once.
     layout: List[tuple[int, int]] = [None] * 6  # type: ignore[list-item]
-    for idx, piece_id in enumerate(order):
-        if not 1 <= piece_id <= 6:
-            raise ValueError("piece id must be between 1 and 6")
-        layout[piece_id - 1] = start_cells[idx]
-    if any(cell is None for cell in layout):
-        raise ValueError("layout missing coordinates")
-    return layout  # type: ignore[return-value]
-
-
-def _format_board(board: List[List[int]]) -> str:
-    lines: List[str] = []
-    for row in board:
-        cells = []
-        for cell in row:
-            if cell == 0:
-                cells.append(" . ")
-            elif cell > 0:
-                cells.append(f"R{cell}")
-            else:
-                cells.append(f"B{abs(cell)}")
-        lines.append(" ".join(cells))
-    return "\n".join(lines)
+    for piece_id, cell in zip(order, start_cells):
+        layout[piece_id - 1] = cell
+    return layout
 
 
 def play_game(
@@ -96,38 +117,58 @@ def play_game(
     red_order: Optional[Sequence[int]],
     blue_order: Optional[Sequence[int]],
     save_wtn_path: Optional[str] = None,
+    precomputed_red_layout: Optional[Sequence[tuple[int, int]]] = None,
+    precomputed_blue_layout: Optional[Sequence[tuple[int, int]]] = None,
+    reset_tt: bool = False,
+    buffer_output: bool = False,
 ) -> GameSummary:
     rng = random.Random(seed)
-    time_remaining = {
-        Player.RED: float("inf") if time_limit_seconds is None else float(time_limit_seconds),
-        Player.BLUE: float("inf") if time_limit_seconds is None else float(time_limit_seconds),
-    }
-    move_times: Dict[Player, List[float]] = {Player.RED: [], Player.BLUE: []}
-    search_stats: Dict[Player, List[SearchStats]] = {Player.RED: [], Player.BLUE: []}
+    if reset_tt:
+        # Search agents keep their transposition tables between games unless asked not to.
+        for agent in (red_agent, blue_agent):
+            if hasattr(agent, "reset_tt"):
+                agent.reset_tt()
+    # Remaining clock per side in integer nanoseconds; None when the game is untimed.
+    limit_ns = None if time_limit_seconds is None else time_limit_seconds * 1_000_000_000
+    # Per-side bookkeeping is indexed by side (0 Red, 1 Blue) to avoid hashing Player per ply;
+    # the summary dicts share the same lists.
+    time_remaining_ns: List[Optional[int]] = [limit_ns, limit_ns]
+    side_move_times: tuple[List[float], List[float]] = ([], [])
+    side_search_stats: tuple[List[SearchStats], List[SearchStats]] = ([], [])
+    move_times = {Player.RED: side_move_times[0], Player.BLUE: side_move_times[1]}
+    search_stats = {Player.RED: side_search_stats[0], Player.BLUE: side_search_stats[1]}
 
     def _layout_budget(player: Player) -> Optional[int]:
-        remaining = time_remaining[player]
-        if remaining == float("inf"):
+        remaining_ns = time_remaining_ns[0 if player is Player.RED else 1]
+        if remaining_ns is None:
             return None
-        return max(0, int(min(remaining * 1000, 600)))
+        return max(0, min(remaining_ns // 1_000_000, 600))
 
     def _select_order(agent, player: Player, provided: Optional[Sequence[int]]) -> List[int]:
-        start = time.monotonic()
+        start = time.perf_counter_ns()
         if provided is not None:
             order = list(provided)
         else:
             order = agent.choose_initial_layout(player, time_budget_ms=_layout_budget(player))
-        elapsed = time.monotonic() - start
-        time_remaining[player] -= elapsed
-        if time_remaining[player] < 0:
-            raise TimeoutError(player)
-        if len(order) != 6 or sorted(order) != [1, 2, 3, 4, 5, 6]:
+        if limit_ns is not None:
+            side = 0 if player is Player.RED else 1
+            time_remaining_ns[side] -= time.perf_counter_ns() - start
+            if time_remaining_ns[side] < 0:
+                raise TimeoutError(player)
+        if not _is_piece_permutation(order):
             raise ValueError(f"Invalid layout permutation from {player.name}: {order}")
         return order
 
+    # Precomputed layouts (fixed orders reused across a match) skip layout selection entirely.
+    layout_red = precomputed_red_layout
+    layout_blue = precomputed_blue_layout
     try:
-        red_order_final = _select_order(red_agent, Player.RED, red_order)
-        blue_order_final = _select_order(blue_agent, Player.BLUE, blue_order)
+        if layout_red is None:
+            layout_red = arrangement_to_layout(_select_order(red_agent, Player.RED, red_order), engine.START_RED_CELLS)
+        if layout_blue is None:
+            layout_blue = arrangement_to_layout(
+                _select_order(blue_agent, Player.BLUE, blue_order), engine.START_BLUE_CELLS
+            )
     except TimeoutError as exc:
         timed_out_player: Player = exc.args[0]
         if emit_moves or show_board:
@@ -139,126 +180,177 @@ def play_game(
             search_stats=search_stats,
         )
 
-    layout_red = arrangement_to_layout(red_order_final, engine.START_RED_CELLS)
-    layout_blue = arrangement_to_layout(blue_order_final, engine.START_BLUE_CELLS)
     state = engine.new_game(layout_red, layout_blue, first=first)
-    moves_log: List[Tuple[int, int, str, int, int, int]] = []
+    red_agent_name = red_agent.__class__.__name__
+    blue_agent_name = blue_agent.__class__.__name__
+    # Per-side switches for the post-move stats block; all False on headless runs.
+    red_collects = collect_stats and getattr(red_agent, "SUPPORTS_SEARCH_STATS", False)
+    blue_collects = collect_stats and getattr(blue_agent, "SUPPORTS_SEARCH_STATS", False)
+    red_shows_opening = show_stats and hasattr(red_agent, "last_opening_stats")
+    blue_shows_opening = show_stats and hasattr(blue_agent, "last_opening_stats")
+    any_stats = red_collects or blue_collects or red_shows_opening or blue_shows_opening
+
+    # Saved games are streamed: header now, one line per move, result comments at the end.
+    # The record is written under a temporary name and renamed once the game is over, so a
+    # game that raises part-way never leaves a truncated file at save_wtn_path.
+    wtn_file = None
+    wtn_tmp_path = None
+    if save_wtn_path is not None:
+        wtn_tmp_path = save_wtn_path + ".part"
+        wtn_file = open(wtn_tmp_path, "w", encoding="utf-8", buffering=1 << 16)
+        wtn_file.write(
+            f"# red_agent={red_agent_name}\n"
+            f"# blue_agent={blue_agent_name}\n"
+            f"{dump_layout_line(dict(enumerate(layout_red, start=1)), 'R')}\n"
+            f"{dump_layout_line(dict(enumerate(layout_blue, start=1)), 'B')}\n"
+        )
 
     def _maybe_save_wtn(winner: Player, turns: int) -> None:
-        if save_wtn_path is None:
+        if wtn_file is None:
             return
-        red_layout_dict = {pid: coord for pid, coord in enumerate(layout_red, start=1)}
-        blue_layout_dict = {pid: coord for pid, coord in enumerate(layout_blue, start=1)}
-        comments = [
-            f"# red_agent={red_agent.__class__.__name__}",
-            f"# blue_agent={blue_agent.__class__.__name__}",
-            f"# winner={winner.name}",
-            f"# turns={turns}",
-        ]
-        game = WTNGame(
-            comments=comments,
-            red_layout=red_layout_dict,
-            blue_layout=blue_layout_dict,
-            moves=moves_log,
-        )
-        with open(save_wtn_path, "w", encoding="utf-8") as f:
-            f.write(dump_wtn(game))
-
-    turn_counter = 1
-    while True:
-        player = state.turn
-        dice = rng.randint(1, 6)
-        agent = red_agent if player is Player.RED else blue_agent
-        remaining_ms = time_remaining[player] * 1000 if time_limit_seconds is not None else None
-        budget_flags = []
-        if time_limit_seconds is None:
-            budget_ms = None
-        else:
-            budget_ms = compute_move_budget_ms(
-                state,
-                dice,
-                remaining_ms=remaining_ms,
-                agent_name=agent.__class__.__name__,
-                cfg=TimeManagerConfig(),
-            )
-            budget_flags = getattr(compute_move_budget_ms, "last_flags", [])
-
-        start = time.monotonic()
-        move = agent.choose_move(state, dice, time_budget_ms=budget_ms)
-        elapsed = time.monotonic() - start
-        time_remaining[player] -= elapsed
-        move_times[player].append(elapsed * 1000.0)
-        if time_remaining[player] < 0:
-            if emit_moves or show_board:
-                print(f"{player.name} exceeded time. {player.opponent().name} wins by timeout.")
-            _maybe_save_wtn(player.opponent(), turn_counter)
-            return GameSummary(
-                winner=player.opponent(),
-                turns=turn_counter,
-                move_times=move_times,
-                search_stats=search_stats,
-            )
+        wtn_file.write(f"# winner={winner.name}\n# turns={turns}\n")
 
-        if emit_moves:
-            print(f"Turn {turn_counter}: {player.name} rolled {dice} -> {move}")
-        moves_log.append(
-            (
-                turn_counter,
-                dice,
-                "R" if player is Player.RED else "B",
-                move.piece_id,
-                move.to_rc[0],
-                move.to_rc[1],
-            )
-        )
-        state = engine.apply_move(state, move)
-        turn_counter += 1
-
-        if show_board:
-            print(_format_board(state.board))
-            print()
-
-        is_search_agent = isinstance(agent, (ExpectiminimaxAgent, OpeningExpectiAgent))
-        if collect_stats and is_search_agent and getattr(agent, "last_stats", None) is not None:
-            stats = agent.last_stats
-            total_tt = stats.tt_hits + stats.tt_stores
-            hit_rate = 0.0 if total_tt == 0 else stats.tt_hits / total_tt
-            if show_stats:
-                flag_str = "[" + ",".join(budget_flags) + "]" if budget_flags else "[]"
-                remaining_after = max(0.0, time_remaining[player])
-                print(
-                    f"{player.name} expecti stats: depth={stats.depth_reached} nodes={stats.nodes} "
-                    f"tt_hit_rate={hit_rate:.3f} tt_exact={stats.tt_exact_hits} "
-                    f"tt_lower={stats.tt_lower_hits} tt_upper={stats.tt_upper_hits} "
-                    f"tt_cutoffs={stats.tt_cutoffs} tt_bestmove_hits={stats.tt_bestmove_hits} "
-                    f"tt_bestmove_stores={stats.tt_bestmove_stores} "
-                    f"killer_hits={stats.killer_hits} history_hits={stats.history_hits} "
-                    f"pv_hits={stats.pv_hits} pv_root={stats.pv_hits_root} pv_dec={stats.pv_hits_decision} "
-                    f"killer_size={stats.killer_size} history_size={stats.history_size} "
-                    f"elapsed_ms={stats.elapsed_ms:.2f} "
-                    f"remaining_ms={remaining_after*1000:.1f} budget_ms={budget_ms if budget_ms is not None else -1} "
-                    f"flags={flag_str}"
+    # With buffer_output, per-move text goes to memory and is written to stdout once at the end.
+    out = io.StringIO() if buffer_output else None
+    try:
+        # Untimed games (the default for tests and analysis) skip all clock and budget work.
+        timed = limit_ns is not None
+        tm_cfg = TimeManagerConfig()
+        # randint(1, 6) is randrange(1, 7), which is 1 + _randbelow(6): same draws, fewer calls.
+        roll_below = rng._randbelow
+        red_name, blue_name = Player.RED.name, Player.BLUE.name
+        turn_counter = 1
+        while True:
+            player = state.turn
+            is_red = player is Player.RED
+            side = 0 if is_red else 1
+            player_name = red_name if is_red else blue_name
+            dice = roll_below(6) + 1
+            agent = red_agent if is_red else blue_agent
+            if timed:
+                budget_ms, budget_flags, _, _ = compute_move_budget(
+                    state,
+                    dice,
+                    remaining_ms=time_remaining_ns[side] // 1_000_000,
+                    agent_name=red_agent_name if is_red else blue_agent_name,
+                    cfg=tm_cfg,
                 )
-            search_stats[player].append(stats)
-        if show_stats and hasattr(agent, "last_opening_stats") and getattr(agent, "last_opening_stats", None):
-            opening = agent.last_opening_stats
-            print(
-                f"{player.name} opening stats: evaluated={opening.get('evaluated_candidates')} "
-                f"top_k={opening.get('top_k')} elapsed_ms={opening.get('elapsed_ms'):.1f} "
-                f"best_score={opening.get('best_score')}"
-            )
+            else:
+                budget_ms = None
+                budget_flags = []
+
+            start = time.perf_counter_ns()
+            move = agent.choose_move(state, dice, time_budget_ms=budget_ms)
+            elapsed_ns = time.perf_counter_ns() - start
+            side_move_times[side].append(elapsed_ns / 1e6)
+            if timed:
+                time_remaining_ns[side] -= elapsed_ns
+                if time_remaining_ns[side] < 0:
+                    opponent = Player.BLUE if is_red else Player.RED
+                    if emit_moves or show_board:
+                        opponent_name = blue_name if is_red else red_name
+                        print(f"{player_name} exceeded time. {opponent_name} wins by timeout.", file=out)
+                    _maybe_save_wtn(opponent, turn_counter)
+                    return GameSummary(
+                        winner=opponent,
+                        turns=turn_counter,
+                        move_times=move_times,
+                        search_stats=search_stats,
+                    )
+
+            if emit_moves:
+                print(f"Turn {turn_counter}: {player_name} rolled {dice} -> {move}", file=out)
+            if wtn_file is not None:
+                wtn_file.write(
+                    dump_move_line(
+                        turn_counter,
+                        dice,
+                        _COLOR_CHAR[player],
+                        move.piece_id,
+                        move.to_rc[0],
+                        move.to_rc[1],
+                    )
+                    + "\n"
+                )
+            state = engine.apply_move(state, move)
+            turn_counter += 1
 
-        victor = engine.winner(state)
-        if victor is not None:
             if show_board:
-                print(f"Winner: {victor.name}")
-            _maybe_save_wtn(victor, turn_counter - 1)
-            return GameSummary(
-                winner=victor,
-                turns=turn_counter - 1,
-                move_times=move_times,
-                search_stats=search_stats,
-            )
+                # Board plus the blank separator line in one write.
+                print(format_board(state.board) + "\n", file=out)
+
+            if any_stats:
+                collects = red_collects if is_red else blue_collects
+                if collects and getattr(agent, "last_stats", None) is not None:
+                    stats = agent.last_stats
+                    total_tt = stats.tt_hits + stats.tt_stores
+                    hit_rate = 0.0 if total_tt == 0 else stats.tt_hits / total_tt
+                    if show_stats:
+                        flag_str = "[" + ",".join(budget_flags) + "]" if budget_flags else "[]"
+                        remaining_after_ms = max(0, time_remaining_ns[side]) / 1e6 if timed else float("inf")
+                        print(
+                            _EXPECTI_STATS_LINE
+                            % (
+                                player_name,
+                                stats.depth_reached,
+                                stats.nodes,
+                                hit_rate,
+                                stats.tt_exact_hits,
+                                stats.tt_lower_hits,
+                                stats.tt_upper_hits,
+                                stats.tt_cutoffs,
+                                stats.tt_bestmove_hits,
+                                stats.tt_bestmove_stores,
+                                stats.killer_hits,
+                                stats.history_hits,
+                                stats.pv_hits,
+                                stats.pv_hits_root,
+                                stats.pv_hits_decision,
+                                stats.killer_size,
+                                stats.history_size,
+                                stats.elapsed_ms,
+                                remaining_after_ms,
+                                budget_ms if budget_ms is not None else -1,
+                                flag_str,
+                            ),
+                            file=out,
+                        )
+                    side_search_stats[side].append(stats)
+                shows_opening = red_shows_opening if is_red else blue_shows_opening
+                if shows_opening and agent.last_opening_stats:
+                    opening = agent.last_opening_stats
+                    print(
+                        f"{player_name} opening stats: evaluated={opening.get('evaluated_candidates')} "
+                        f"top_k={opening.get('top_k')} elapsed_ms={opening.get('elapsed_ms'):.1f} "
+                        f"best_score={opening.get('best_score')}",
+                        file=out,
+                    )
+
+            victor = engine.winner(state)
+            if victor is not None:
+                if show_board:
+                    print(f"Winner: {victor.name}", file=out)
+                _maybe_save_wtn(victor, turn_counter - 1)
+                return GameSummary(
+                    winner=victor,
+                    turns=turn_counter - 1,
+                    move_times=move_times,
+                    search_stats=search_stats,
+                )
+
+    except BaseException:
+        if wtn_file is not None:
+            wtn_file.close()
+            os.remove(wtn_tmp_path)
+            wtn_file = None
+        raise
+    finally:
+        if wtn_file is not None:
+            wtn_file.close()
+            os.replace(wtn_tmp_path, save_wtn_path)
+        if out is not None:
+            sys.stdout.write(out.getvalue())
+            sys.stdout.flush()
 
 
 def play_match(
@@ -270,38 +362,170 @@ def play_match(
     show_stats: bool,
     red_order: Optional[Sequence[int]],
     blue_order: Optional[Sequence[int]],
+    workers: int = 1,
+    buffer_output: bool = False,
 ) -> None:
+    """Play a best-of-7 match.
+
+    With ``workers > 1`` the games run concurrently in worker processes, each on a
+    pickled copy of the agents, and per-move output is suppressed. Game seeds match
+    the sequential run, but agent RNG state is not carried from one game to the next.
+    ``buffer_output`` holds each sequential game's per-move output until the game ends.
+    """
+
     base_rng = random.Random(seed)
-    wins = {Player.RED: 0, Player.BLUE: 0}
-    first_order = [Player.RED, Player.BLUE, Player.BLUE, Player.RED, Player.RED, Player.BLUE, Player.BLUE]
-
-    for game_index, first in enumerate(first_order, start=1):
-        if wins[Player.RED] >= 4 or wins[Player.BLUE] >= 4:
-            break
-        game_seed = base_rng.randint(0, 2**31 - 1)
-        if verbose:
-            print(f"=== Game {game_index} (first: {first.name}) ===")
-        summary = play_game(
-            red_agent=red_agent,
-            blue_agent=blue_agent,
-            first=first,
-            seed=game_seed,
-            time_limit_seconds=time_limit_seconds,
-            emit_moves=True,
-            show_board=verbose,
-            show_stats=show_stats,
-            collect_stats=show_stats,
-            red_order=red_order,
-            blue_order=blue_order,
+    red_wins = blue_wins = 0
+    first_order = _MATCH_FIRST_ORDER
+    # Fixed orders give the same layout every game; convert them once for the whole match.
+    red_layout = None if red_order is None else arrangement_to_layout(red_order, engine.START_RED_CELLS)
+    blue_layout = None if blue_order is None else arrangement_to_layout(blue_order, engine.START_BLUE_CELLS)
+
+    if workers > 1:
+        red_wins, blue_wins = _play_match_parallel(
+            red_agent,
+            blue_agent,
+            base_rng,
+            first_order,
+            time_limit_seconds,
+            verbose,
+            red_order,
+            blue_order,
+            red_layout,
+            blue_layout,
+            workers,
         )
-        wins[summary.winner] += 1
-        print(f"Result: {summary.winner.name} wins (score {wins[Player.RED]}-{wins[Player.BLUE]})")
+    else:
+        for game_index, first in enumerate(first_order, start=1):
+            if red_wins >= 4 or blue_wins >= 4:
+                break
+            game_seed = base_rng.randint(0, 2**31 - 1)
+            if verbose:
+                print(f"=== Game {game_index} (first: {first.name}) ===")
+            summary = play_game(
+                red_agent=red_agent,
+                blue_agent=blue_agent,
+                first=first,
+                seed=game_seed,
+                time_limit_seconds=time_limit_seconds,
+                emit_moves=True,
+                show_board=verbose,
+                show_stats=show_stats,
+                collect_stats=show_stats,
+                red_order=red_order,
+                blue_order=blue_order,
+                precomputed_red_layout=red_layout,
+                precomputed_blue_layout=blue_layout,
+                reset_tt=False,
+                buffer_output=buffer_output,
+            )
+            if summary.winner is Player.RED:
+                red_wins += 1
+            else:
+                blue_wins += 1
+            print(f"Result: {summary.winner.name} wins (score {red_wins}-{blue_wins})")
 
-    overall = Player.RED if wins[Player.RED] > wins[Player.BLUE] else Player.BLUE
+    overall = Player.RED if red_wins > blue_wins else Player.BLUE
     print(f"Match winner: {overall.name}")
 
 
-def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+def _play_match_game(
+    red_agent,
+    blue_agent,
+    first: Player,
+    seed: int,
+    time_limit_seconds: Optional[int],
+    red_order: Optional[Sequence[int]],
+    blue_order: Optional[Sequence[int]],
+    red_layout: Optional[Sequence[tuple[int, int]]],
+    blue_layout: Optional[Sequence[tuple[int, int]]],
+) -> GameSummary:
+    """Worker entry point for parallel matches: one quiet game on fresh transposition tables.
+
+    Each submission gets its own pickled copy of the agents, so a table carried over from
+    the parent would only make results depend on what the parent searched before.
+    """
+
+    return play_game(
+        red_agent=red_agent,
+        blue_agent=blue_agent,
+        first=first,
+        seed=seed,
+        time_limit_seconds=time_limit_seconds,
+        emit_moves=False,
+        show_board=False,
+        show_stats=False,
+        collect_stats=False,
+        red_order=red_order,
+        blue_order=blue_order,
+        precomputed_red_layout=red_layout,
+        precomputed_blue_layout=blue_layout,
+        reset_tt=True,
+    )
+
+
+def _play_match_parallel(
+    red_agent,
+    blue_agent,
+    base_rng: random.Random,
+    first_order: Sequence[Player],
+    time_limit_seconds: Optional[int],
+    verbose: bool,
+    red_order: Optional[Sequence[int]],
+    blue_order: Optional[Sequence[int]],
+    red_layout: Optional[Sequence[tuple[int, int]]],
+    blue_layout: Optional[Sequence[tuple[int, int]]],
+    workers: int,
+) -> tuple[int, int]:
+    """Play the match games in worker processes and return the (red, blue) win counts."""
+
+    red_wins = blue_wins = 0
+    # Draw every seed up front so game N gets the same seed as in a sequential match.
+    game_seeds = [base_rng.randint(0, 2**31 - 1) for _ in first_order]
+    # Submission runs in waves: only games the match is certain to need are in flight, so
+    # no worker burns time on a game that a decided score would throw away.
+    max_workers = min(workers, 4, len(first_order), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        futures = []
+
+        def submit_through(count: int) -> None:
+            while len(futures) < min(count, len(first_order)):
+                index = len(futures)
+                futures.append(
+                    pool.submit(
+                        _play_match_game,
+                        red_agent,
+                        blue_agent,
+                        first_order[index],
+                        game_seeds[index],
+                        time_limit_seconds,
+                        red_order,
+                        blue_order,
+                        red_layout,
+                        blue_layout,
+                    )
+                )
+
+        # Tally in game order so the reported score progression matches a sequential match.
+        for game_index, first in enumerate(first_order, start=1):
+            leader = max(red_wins, blue_wins)
+            if leader >= 4:
+                break
+            submit_through(game_index - 1 + 4 - leader)
+            summary = futures[game_index - 1].result()
+            if verbose:
+                print(f"=== Game {game_index} (first: {first.name}) ===")
+            if summary.winner is Player.RED:
+                red_wins += 1
+            else:
+                blue_wins += 1
+            print(f"Result: {summary.winner.name} wins (score {red_wins}-{blue_wins})")
+    return red_wins, blue_wins
+
+
+@functools.lru_cache(maxsize=1)
+def _get_parser() -> argparse.ArgumentParser:
+    """Build the CLI parser once; repeated programmatic main() calls reuse it."""
+
     parser = argparse.ArgumentParser(description="Einstein WTN runner")
     parser.add_argument("--mode", choices=["game", "match"], required=True)
     parser.add_argument(
@@ -317,7 +541,25 @@ def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
     parser.add_argument("--blue-layout", type=str, default=None, help="Comma-separated permutation like 6,5,4,3,2,1")
     parser.add_argument("--stats", action="store_true", help="Print expecti search stats each move")
     parser.add_argument("--save-wtn", type=str, default=None, help="Path to save WTN record for the game")
-    return parser.parse_args(argv)
+    parser.add_argument(
+        "--parallel-root",
+        type=int,
+        default=0,
+        help="Worker processes for root-parallel expecti search (0 or 1 searches in-process)",
+    )
+    parser.add_argument(
+        "--workers", type=int, default=1, help="Worker processes for match mode (1 plays games sequentially)"
+    )
+    parser.add_argument(
+        "--buffer-output",
+        action="store_true",
+        help="Hold per-move output and print it in one write when each game ends",
+    )
+    return parser
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    return _get_parser().parse_args(argv)
 
 
 def main(argv: Optional[List[str]] = None) -> None:
@@ -334,8 +576,10 @@ def main(argv: Optional[List[str]] = None) -> None:
         print("--save-wtn is only supported in game mode")
         raise SystemExit(1)
 
-    red_agent = _build_agent(args.red, seed=args.seed)
-    blue_agent = _build_agent(args.blue, seed=None if args.seed is None else args.seed + 1)
+    red_agent = _build_agent(args.red, seed=args.seed, parallel_root=args.parallel_root)
+    blue_agent = _build_agent(
+        args.blue, seed=None if args.seed is None else args.seed + 1, parallel_root=args.parallel_root
+    )
 
     try:
         if args.mode == "game":
@@ -352,6 +596,7 @@ def main(argv: Optional[List[str]] = None) -> None:
                 red_order=red_order,
                 blue_order=blue_order,
                 save_wtn_path=args.save_wtn,
+                buffer_output=args.buffer_output,
             )
             print(f"Game winner: {summary.winner.name}")
         else:
@@ -364,10 +609,17 @@ def main(argv: Optional[List[str]] = None) -> None:
                 show_stats=args.stats,
                 red_order=red_order,
                 blue_order=blue_order,
+                workers=args.workers,
+                buffer_output=args.buffer_output,
             )
     except ValueError as exc:
         print(f"Invalid configuration: {exc}")
         raise SystemExit(1)
+    finally:
+        # --parallel-root agents own a worker pool; shut it down rather than leave it to exit.
+        for agent in (red_agent, blue_agent):
+            if hasattr(agent, "close_root_pool"):
+                agent.close_root_pool()
 
 
 if __name__ == "__main__":
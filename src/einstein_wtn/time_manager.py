@@ -2,13 +2,13 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Iterable, List, Sequence, Tuple
+from typing import Dict, List, NamedTuple, Tuple
 
 from . import engine
 from .types import Player
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TimeManagerConfig:
     base_frac: float = 0.06
     min_ms: int = 8
@@ -18,71 +18,123 @@ class TimeManagerConfig:
     hurry_mult: float = 0.7
 
 
-def _reachable_squares_for_pieces(positions: Sequence[Tuple[int, int] | None], directions: Iterable[Tuple[int, int]]) -> set[tuple[int, int]]:
-    squares: set[tuple[int, int]] = set()
-    for coord in positions:
-        if coord is None:
-            continue
-        r, c = coord
-        for dr, dc in directions:
-            nr, nc = r + dr, c + dc
-            if 0 <= nr < engine.BOARD_SIZE and 0 <= nc < engine.BOARD_SIZE:
-                squares.add((nr, nc))
-    return squares
-
-
-def _has_immediate_win(state, dice: int, player: Player) -> bool:
-    moves = engine.generate_legal_moves(state, dice)
-    for mv in moves:
-        next_state = engine.apply_move(state, mv)
-        if engine.winner(next_state) == player:
-            return True
-    return False
-
-
-def _opponent_win_threat(state, player: Player) -> bool:
-    opponent = player.opponent()
-    target = engine.TARGET_BLUE if opponent is Player.BLUE else engine.TARGET_RED
-    dirs = engine.DIRECTIONS_BLUE if opponent is Player.BLUE else engine.DIRECTIONS_RED
-    for pid, coord in (state.pos_blue.items() if opponent is Player.BLUE else state.pos_red.items()):
-        if coord is None:
-            continue
-        r, c = coord
-        for dr, dc in dirs:
-            nr, nc = r + dr, c + dc
-            if (nr, nc) == target:
-                for dice in range(1, 7):
-                    candidates = engine.get_movable_piece_ids(state, opponent, dice)
-                    if pid in candidates:
-                        return True
-    return False
-
-
-def _capture_opportunity(state, dice: int, player: Player) -> bool:
-    moves = engine.generate_legal_moves(state, dice)
-    for mv in moves:
-        r, c = mv.to_rc
-        occupant = state.board[r][c]
-        if (occupant > 0 and player is Player.BLUE) or (occupant < 0 and player is Player.RED):
-            return True
-    return False
+# Immutable, so one shared instance serves every call made without an explicit config.
+_DEFAULT_CONFIG = TimeManagerConfig()
+
+
+class MoveBudget(NamedTuple):
+    """Result of one budget computation; unpack it instead of reading function attributes."""
+
+    budget_ms: int
+    flags: List[str]
+    baseline_ms: float
+    safe_cap_ms: float
+
+
+# Per side to move, indexed by ``state.turn is Player.RED`` (False: Blue, True: Red):
+# own target corner, opponent step masks, and the bit of the opponent's target corner.
+_SIDE_TABLES = (
+    (engine.TARGET_BLUE, engine.STEP_MASKS_RED, 1 << engine.cell_index(*engine.TARGET_RED)),
+    (engine.TARGET_RED, engine.STEP_MASKS_BLUE, 1 << engine.cell_index(*engine.TARGET_BLUE)),
+)
 
 
-def _danger_incoming(state, player: Player) -> bool:
-    opponent = player.opponent()
-    dirs = engine.DIRECTIONS_RED if opponent is Player.RED else engine.DIRECTIONS_BLUE
-    positions = state.pos_red.values() if opponent is Player.RED else state.pos_blue.values()
-    reach = _reachable_squares_for_pieces(positions, dirs)
-    own_positions = state.pos_red.values() if player is Player.RED else state.pos_blue.values()
-    return any(coord is not None and coord in reach for coord in own_positions)
+class _Urgency(NamedTuple):
+    immediate: bool
+    capture: bool
+    threat: bool
+    danger: bool
+    endgame: bool
+    alive_red: int
+    alive_blue: int
 
 
-def _alive_count(state) -> int:
-    return sum(1 for coord in state.pos_red.values() if coord is not None) + sum(
-        1 for coord in state.pos_blue.values() if coord is not None
+def _analyze_urgency(state, dice: int) -> _Urgency:
+    """Compute every urgency signal in one pass over the moves and one over the pieces."""
+
+    is_red = state.turn is Player.RED
+    board = state.board
+    target, opp_steps, opp_target_bit = _SIDE_TABLES[is_red]
+    opp_alive_mask = state.alive_blue if is_red else state.alive_red
+
+    # A move wins by reaching the target corner or by capturing the opponent's last piece.
+    immediate = capture = False
+    for mv in engine.generate_legal_moves(state, dice):
+        if mv.to_rc == target:
+            immediate = True
+        r, c = mv.to_rc
+        occupant = board[r][c]
+        if occupant < 0 if is_red else occupant > 0:
+            capture = True
+            if opp_alive_mask == 1 << (abs(occupant) - 1):
+                immediate = True
+        if immediate and capture:
+            break
+
+    own_positions = state.pos_red if is_red else state.pos_blue
+    opp_positions = state.pos_blue if is_red else state.pos_red
+    size = engine.BOARD_SIZE
+    own_cells = 0
+    for coord in own_positions.values():
+        if coord is not None:
+            own_cells |= 1 << (coord[0] * size + coord[1])
+    opp_reach = 0
+    for coord in opp_positions.values():
+        if coord is not None:
+            opp_reach |= opp_steps[coord[0] * size + coord[1]]
+    alive_red = state.alive_red.bit_count()
+    alive_blue = state.alive_blue.bit_count()
+
+    # Any live piece is movable on its own dice value, so every opponent step is a real threat.
+    return _Urgency(
+        immediate=immediate,
+        capture=capture,
+        threat=bool(opp_reach & opp_target_bit),
+        danger=bool(opp_reach & own_cells),
+        endgame=alive_red + alive_blue <= 4,
+        alive_red=alive_red,
+        alive_blue=alive_blue,
     )
 
 
+# Urgency flags depend only on the position and dice, so repeated positions (openings,
+# transpositions across games) reuse them. Keyed by Zobrist hash; oldest entries evicted first.
+_URGENCY_CACHE: Dict[Tuple[int, int], Tuple[Tuple[str, ...], int]] = {}
+_URGENCY_CACHE_MAX = 1 << 16
+
+
+def _urgency(state, dice: int) -> Tuple[Tuple[str, ...], int]:
+    """Urgency flags and material lead for the side to move."""
+
+    cache_key = (state.zobrist(), dice)
+    cached = _URGENCY_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+
+    u = _analyze_urgency(state, dice)
+    flags: List[str] = []
+    if u.immediate:
+        flags.append("WIN")
+    if u.threat:
+        flags.append("THREAT")
+    if u.capture:
+        flags.append("CAP")
+    if u.danger:
+        flags.append("DANGER")
+    if u.endgame:
+        flags.append("ENDGAME")
+
+    lead = 0
+    if not flags:
+        lead = u.alive_red - u.alive_blue if state.turn is Player.RED else u.alive_blue - u.alive_red
+
+    if len(_URGENCY_CACHE) >= _URGENCY_CACHE_MAX:
+        del _URGENCY_CACHE[next(iter(_URGENCY_CACHE))]
+    result = (tuple(flags), lead)
+    _URGENCY_CACHE[cache_key] = result
+    return result
+
+
 def compute_move_budget_ms(
     state,
     dice: int,
@@ -90,49 +142,47 @@ def compute_move_budget_ms(
     agent_name: str,
     cfg: TimeManagerConfig | None = None,
 ) -> int:
-    """Compute a per-move budget based on urgency and remaining time."""
+    """Compute a per-move budget based on urgency and remaining time.
+
+    Also records the full :class:`MoveBudget` as ``last_budget`` on the function (one
+    attribute write; read ``.flags``/``.baseline_ms`` from it). Callers that need those
+    should use :func:`compute_move_budget` instead.
+    """
+
+    budget = compute_move_budget(state, dice, remaining_ms, agent_name, cfg)
+    compute_move_budget_ms.last_budget = budget  # type: ignore[attr-defined]
+    return budget.budget_ms
+
+
+def compute_move_budget(
+    state,
+    dice: int,
+    remaining_ms: float | int,
+    agent_name: str,
+    cfg: TimeManagerConfig | None = None,
+) -> MoveBudget:
+    """Compute a per-move budget plus the urgency flags and baseline behind it."""
 
-    cfg = cfg or TimeManagerConfig()
+    cfg = cfg or _DEFAULT_CONFIG
     _ = agent_name  # Reserved for future agent-specific tuning.
     if remaining_ms is None or remaining_ms == float("inf"):
-        return cfg.max_ms
+        return MoveBudget(cfg.max_ms, [], float("inf"), float("inf"))
 
     baseline = remaining_ms * cfg.base_frac
-    player = state.turn
-    flags: List[str] = []
-
-    immediate = _has_immediate_win(state, dice, player)
-    if immediate:
-        flags.append("WIN")
-    opponent_threat = _opponent_win_threat(state, player)
-    if opponent_threat:
-        flags.append("THREAT")
-    capture = _capture_opportunity(state, dice, player)
-    if capture:
-        flags.append("CAP")
-    danger = _danger_incoming(state, player)
-    if danger:
-        flags.append("DANGER")
-    endgame = _alive_count(state) <= 4
-    if endgame:
-        flags.append("ENDGAME")
+    flags, lead = _urgency(state, dice)
 
     multiplier = 1.0
-    if immediate or opponent_threat:
+    if "WIN" in flags or "THREAT" in flags:
         multiplier *= cfg.critical_mult
-    if capture:
+    if "CAP" in flags:
         multiplier *= 1.2
-    if danger:
+    if "DANGER" in flags:
         multiplier *= 1.2
-    if endgame:
+    if "ENDGAME" in flags:
         multiplier *= cfg.endgame_mult
 
-    if not flags:
-        red_alive = sum(1 for coord in state.pos_red.values() if coord is not None)
-        blue_alive = sum(1 for coord in state.pos_blue.values() if coord is not None)
-        lead = red_alive - blue_alive if player is Player.RED else blue_alive - red_alive
-        if lead >= 2:
-            multiplier *= cfg.hurry_mult
+    if not flags and lead >= 2:
+        multiplier *= cfg.hurry_mult
 
     budget = baseline * multiplier
     budget = min(budget, cfg.max_ms)
@@ -146,6 +196,4 @@ def compute_move_budget_ms(
         budget = max(cfg.min_ms, budget)
         budget = min(budget, remaining_ms)
 
-    compute_move_budget_ms.last_flags = flags  # type: ignore[attr-defined]
-    compute_move_budget_ms.last_baseline = baseline  # type: ignore[attr-defined]
-    return int(max(0, budget))
+    return MoveBudget(int(max(0, budget)), list(flags), baseline, safe_cap)
@@ -7,13 +7,16 @@ Usage example:
 from __future__ import annotations
 
 import argparse
+import functools
+import operator
+import os
 import random
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
-from typing import Dict, Optional, Sequence
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
 
 from .agents import ExpectiminimaxAgent, HeuristicAgent, OpeningExpectiAgent, RandomAgent, SearchStats
-from .opening import LayoutSearchAgent
-from .runner import parse_layout_string, play_game
+from .runner import GameSummary, parse_layout_string, play_game
 from .types import Player
 
 
@@ -43,28 +46,76 @@ def _build_agent(name: str, seed: Optional[int]):
     if name == "expecti":
         return ExpectiminimaxAgent(seed=seed)
     if name == "layoutsearch":
+        # Only layout-search runs need the opening module; workers and other runs skip its import.
+        from .opening import LayoutSearchAgent
+
         return LayoutSearchAgent(seed=seed)
     if name in {"opening-expecti", "opening_expecti"}:
         return OpeningExpectiAgent(seed=seed)
     raise ValueError(f"Unknown agent '{name}'")
 
 
-def _average(values):
-    return 0.0 if not values else sum(values) / len(values)
+@dataclass
+class _SearchTotals:
+    """Running sums of per-move search stats for one side."""
+
+    samples: int = 0
+    depth: int = 0
+    nodes: int = 0
+    tt_hits: int = 0
+    tt_stores: int = 0
+
+    def add(self, records: Sequence[SearchStats]) -> None:
+        # sum(map(attrgetter)) keeps each field's loop in C.
+        self.samples += len(records)
+        self.depth += sum(map(operator.attrgetter("depth_reached"), records))
+        self.nodes += sum(map(operator.attrgetter("nodes"), records))
+        self.tt_hits += sum(map(operator.attrgetter("tt_hits"), records))
+        self.tt_stores += sum(map(operator.attrgetter("tt_stores"), records))
+
+    def merge(self, other: "_SearchTotals") -> None:
+        self.samples += other.samples
+        self.depth += other.depth
+        self.nodes += other.nodes
+        self.tt_hits += other.tt_hits
+        self.tt_stores += other.tt_stores
+
+    def summary(self) -> SideSearchSummary:
+        if not self.samples:
+            return SideSearchSummary(samples=0, avg_depth=0.0, avg_nodes=0.0, tt_hit_rate=0.0)
+        total = self.tt_hits + self.tt_stores
+        return SideSearchSummary(
+            samples=self.samples,
+            avg_depth=self.depth / self.samples,
+            avg_nodes=self.nodes / self.samples,
+            tt_hit_rate=0.0 if total == 0 else self.tt_hits / total,
+        )
 
 
-def _summarize_search(records) -> SideSearchSummary:
-    if not records:
-        return SideSearchSummary(samples=0, avg_depth=0.0, avg_nodes=0.0, tt_hit_rate=0.0)
-    hits = sum(s.tt_hits for s in records)
-    stores = sum(s.tt_stores for s in records)
-    total = hits + stores
-    hit_rate = 0.0 if total == 0 else hits / total
-    return SideSearchSummary(
-        samples=len(records),
-        avg_depth=_average([s.depth_reached for s in records]),
-        avg_nodes=_average([s.nodes for s in records]),
-        tt_hit_rate=hit_rate,
+@dataclass
+class _GameTally:
+    """Per-game aggregates; what workers send back instead of per-move lists."""
+
+    winner: Player
+    turns: int
+    move_time_sum: Tuple[float, float]
+    move_count: Tuple[int, int]
+    search: Tuple[_SearchTotals, _SearchTotals]
+
+
+def _tally_game(summary: GameSummary, collect_stats: bool) -> _GameTally:
+    search = (_SearchTotals(), _SearchTotals())
+    if collect_stats:
+        search[0].add(summary.search_stats[Player.RED])
+        search[1].add(summary.search_stats[Player.BLUE])
+    red_times = summary.move_times[Player.RED]
+    blue_times = summary.move_times[Player.BLUE]
+    return _GameTally(
+        winner=summary.winner,
+        turns=summary.turns,
+        move_time_sum=(sum(red_times), sum(blue_times)),
+        move_count=(len(red_times), len(blue_times)),
+        search=search,
     )
 
 
@@ -78,52 +129,84 @@ def run_tournament(
     blue_layout: Optional[Sequence[int]] = None,
     quiet: bool = True,
     collect_stats: bool = False,
+    workers: int = 1,
+    tt_persist: bool = True,
 ) -> TournamentResult:
+    """Play ``games`` games alternating the first player and aggregate the results.
+
+    With ``workers > 1`` the games run in worker processes, each holding its own pickled
+    copy of the agents, and per-move output is suppressed. Game seeds match the
+    sequential run, but agent RNG and table state are per worker rather than shared.
+    Search agents keep their transposition tables from one game to the next unless
+    ``tt_persist`` is False.
+    """
+
     rng = random.Random(seed)
     red_wins = 0
     blue_wins = 0
     total_turns = 0
-    move_times: Dict[Player, list[float]] = {Player.RED: [], Player.BLUE: []}
-    search_records: Dict[Player, list[SearchStats]] = {Player.RED: [], Player.BLUE: []}
-
-    for game_index in range(games):
-        first = Player.RED if game_index % 2 == 0 else Player.BLUE
-        game_seed = rng.randint(0, 2**31 - 1)
-        summary = play_game(
-            red_agent=red_agent,
-            blue_agent=blue_agent,
-            first=first,
-            seed=game_seed,
-            time_limit_seconds=time_limit_seconds,
-            emit_moves=not quiet,
-            show_board=False,
-            show_stats=False,
-            collect_stats=collect_stats,
-            red_order=red_layout,
-            blue_order=blue_layout,
+    # Streamed per side: (sum of move times in ms, move count), and search-stat totals.
+    move_time_sum = [0.0, 0.0]
+    move_count = [0, 0]
+    search_totals = (_SearchTotals(), _SearchTotals())
+
+    schedule = [
+        (Player.RED if game_index % 2 == 0 else Player.BLUE, rng.randint(0, 2**31 - 1)) for game_index in range(games)
+    ]
+    if workers > 1 and games > 1:
+        tallies = _play_tournament_parallel(
+            red_agent,
+            blue_agent,
+            schedule,
+            time_limit_seconds,
+            red_layout,
+            blue_layout,
+            collect_stats,
+            workers,
+            tt_persist,
+        )
+    else:
+        tallies = (
+            _tally_game(
+                play_game(
+                    red_agent=red_agent,
+                    blue_agent=blue_agent,
+                    first=first,
+                    seed=game_seed,
+                    time_limit_seconds=time_limit_seconds,
+                    emit_moves=not quiet,
+                    show_board=False,
+                    show_stats=False,
+                    collect_stats=collect_stats,
+                    red_order=red_layout,
+                    blue_order=blue_layout,
+                    reset_tt=not tt_persist,
+                ),
+                collect_stats,
+            )
+            for first, game_seed in schedule
         )
 
-        total_turns += summary.turns
-        move_times[Player.RED].extend(summary.move_times[Player.RED])
-        move_times[Player.BLUE].extend(summary.move_times[Player.BLUE])
-        if summary.winner is Player.RED:
+    for tally in tallies:
+        total_turns += tally.turns
+        for side in (0, 1):
+            move_time_sum[side] += tally.move_time_sum[side]
+            move_count[side] += tally.move_count[side]
+            search_totals[side].merge(tally.search[side])
+        if tally.winner is Player.RED:
             red_wins += 1
         else:
             blue_wins += 1
 
-        if collect_stats:
-            search_records[Player.RED].extend(summary.search_stats[Player.RED])
-            search_records[Player.BLUE].extend(summary.search_stats[Player.BLUE])
-
     avg_turns = total_turns / games if games else 0.0
     avg_move_time_ms = {
-        Player.RED: _average(move_times[Player.RED]),
-        Player.BLUE: _average(move_times[Player.BLUE]),
+        Player.RED: move_time_sum[0] / move_count[0] if move_count[0] else 0.0,
+        Player.BLUE: move_time_sum[1] / move_count[1] if move_count[1] else 0.0,
     }
 
     side_stats = {
-        Player.RED: _summarize_search(search_records[Player.RED]),
-        Player.BLUE: _summarize_search(search_records[Player.BLUE]),
+        Player.RED: search_totals[0].summary(),
+        Player.BLUE: search_totals[1].summary(),
     }
 
     return TournamentResult(
@@ -136,7 +219,76 @@ def run_tournament(
     )
 
 
-def parse_args(argv=None):
+_TOURNAMENT_AGENTS: Optional[Tuple[object, object]] = None
+
+
+def _init_tournament_worker(red_agent, blue_agent) -> None:
+    global _TOURNAMENT_AGENTS
+    _TOURNAMENT_AGENTS = (red_agent, blue_agent)
+
+
+def _play_tournament_game(
+    first: Player,
+    game_seed: int,
+    time_limit_seconds: Optional[int],
+    red_layout: Optional[Sequence[int]],
+    blue_layout: Optional[Sequence[int]],
+    collect_stats: bool,
+    tt_persist: bool,
+) -> _GameTally:
+    red_agent, blue_agent = _TOURNAMENT_AGENTS
+    summary = play_game(
+        red_agent=red_agent,
+        blue_agent=blue_agent,
+        first=first,
+        seed=game_seed,
+        time_limit_seconds=time_limit_seconds,
+        emit_moves=False,
+        show_board=False,
+        show_stats=False,
+        collect_stats=collect_stats,
+        red_order=red_layout,
+        blue_order=blue_layout,
+        reset_tt=not tt_persist,
+    )
+    return _tally_game(summary, collect_stats)
+
+
+def _play_tournament_parallel(
+    red_agent,
+    blue_agent,
+    schedule: List[Tuple[Player, int]],
+    time_limit_seconds: Optional[int],
+    red_layout: Optional[Sequence[int]],
+    blue_layout: Optional[Sequence[int]],
+    collect_stats: bool,
+    workers: int,
+    tt_persist: bool,
+) -> Iterator[_GameTally]:
+    """Yield per-game tallies from a process pool; agents are shipped once per worker."""
+
+    max_workers = min(workers, len(schedule), os.cpu_count() or 1)
+    count = len(schedule)
+    with ProcessPoolExecutor(
+        max_workers=max_workers, initializer=_init_tournament_worker, initargs=(red_agent, blue_agent)
+    ) as pool:
+        yield from pool.map(
+            _play_tournament_game,
+            [first for first, _ in schedule],
+            [game_seed for _, game_seed in schedule],
+            [time_limit_seconds] * count,
+            [red_layout] * count,
+            [blue_layout] * count,
+            [collect_stats] * count,
+            [tt_persist] * count,
+            chunksize=max(1, count // (4 * max_workers)),
+        )
+
+
+@functools.lru_cache(maxsize=1)
+def _get_parser() -> argparse.ArgumentParser:
+    """Build the CLI parser once; repeated programmatic main() calls reuse it."""
+
     parser = argparse.ArgumentParser(description="Einstein WTN tournament/benchmark runner")
     parser.add_argument("--games", type=int, default=200)
     parser.add_argument(
@@ -152,7 +304,24 @@ def parse_args(argv=None):
     parser.add_argument("--stats", action="store_true", help="Collect and print expecti search statistics")
     parser.add_argument("--quiet", dest="quiet", action="store_true", help="Suppress per-move logs", default=True)
     parser.add_argument("--no-quiet", dest="quiet", action="store_false", help="Show per-move logs")
-    return parser.parse_args(argv)
+    parser.add_argument(
+        "--workers", type=int, default=1, help="Worker processes for games (1 plays games sequentially)"
+    )
+    parser.add_argument(
+        "--tt-persist",
+        dest="tt_persist",
+        action="store_true",
+        default=True,
+        help="Keep search transposition tables between games",
+    )
+    parser.add_argument(
+        "--no-tt-persist", dest="tt_persist", action="store_false", help="Clear transposition tables before each game"
+    )
+    return parser
+
+
+def parse_args(argv=None):
+    return _get_parser().parse_args(argv)
 
 
 def main(argv=None):
@@ -178,6 +347,8 @@ def main(argv=None):
         blue_layout=blue_order,
         quiet=args.quiet,
         collect_stats=args.stats,
+        workers=args.workers,
+        tt_persist=args.tt_persist,
     )
 
     print(f"Red wins: {result.red_wins}, Blue wins: {result.blue_wins}")
@@ -8,13 +8,23 @@ Rule reminders (see AGENTS.md):
 
 from __future__ import annotations
 
+import random
 from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, NamedTuple, Optional, Tuple
 
 
 Coord = Tuple[int, int]
 
+# Zobrist keys: ZOBRIST_CELL[cell_index][value + 6] for board values -6..6 (empty hashes to 0),
+# plus one key toggled when Blue is to move. Fixed seed so hashes are stable across processes.
+_zobrist_rng = random.Random(0x5EED)
+ZOBRIST_CELL: Tuple[Tuple[int, ...], ...] = tuple(
+    tuple(0 if value == 0 else _zobrist_rng.getrandbits(64) for value in range(-6, 7)) for _ in range(25)
+)
+ZOBRIST_BLUE_TURN: int = _zobrist_rng.getrandbits(64)
+del _zobrist_rng
+
 
 class Player(Enum):
     """Players in the game."""
@@ -25,11 +35,15 @@ class Player(Enum):
     def opponent(self) -> "Player":
         """Return the opposing player."""
 
-        return Player.RED if self is Player.BLUE else Player.BLUE
+        # Precomputed below: reading ``Player.RED`` goes through the enum class machinery.
+        return self._opponent
+
+
+Player.RED._opponent = Player.BLUE
+Player.BLUE._opponent = Player.RED
 
 
-@dataclass(frozen=True)
-class Move:
+class Move(NamedTuple):
     """A single step move for a piece."""
 
     piece_id: int
@@ -37,7 +51,7 @@ class Move:
     to_rc: Coord
 
 
-@dataclass
+@dataclass(slots=True)
 class GameState:
     """Complete game state for Einstein WTN.
 
@@ -52,26 +66,40 @@ class GameState:
     alive_red: int
     alive_blue: int
     turn: Player
-    _key_cache: Optional[Tuple] = field(default=None, init=False, repr=False, compare=False)
+    _zobrist: Optional[int] = field(default=None, init=False, repr=False, compare=False)
 
     def clone(self) -> "GameState":
         """Return a deep copy of the state."""
 
         clone_state = GameState(
-            board=[row[:] for row in self.board],
-            pos_red={k: v for k, v in self.pos_red.items()},
-            pos_blue={k: v for k, v in self.pos_blue.items()},
+            # C-level copies: map(list.copy) per row, dict.copy for positions (values are tuples).
+            board=list(map(list.copy, self.board)),
+            pos_red=self.pos_red.copy(),
+            pos_blue=self.pos_blue.copy(),
             alive_red=self.alive_red,
             alive_blue=self.alive_blue,
             turn=self.turn,
         )
-        clone_state._key_cache = None if self._key_cache is None else self._key_cache
+        clone_state._zobrist = self._zobrist
         return clone_state
 
-    def key(self) -> Tuple:
-        """Return a hashable key capturing board layout and turn."""
+    def key(self) -> int:
+        """Return a hashable key capturing board layout and turn (the Zobrist hash)."""
+
+        return self.zobrist()
+
+    def zobrist(self) -> int:
+        """Return a 64-bit Zobrist hash of board and turn.
+
+        Computed on first use, then updated incrementally by the engine's move functions.
+        """
 
-        if self._key_cache is None:
-            flattened = tuple(cell for row in self.board for cell in row)
-            self._key_cache = (self.turn, flattened, self.alive_red, self.alive_blue)
-        return self._key_cache
+        if self._zobrist is None:
+            h = ZOBRIST_BLUE_TURN if self.turn is Player.BLUE else 0
+            idx = 0
+            for row in self.board:
+                for cell in row:
+                    h ^= ZOBRIST_CELL[idx][cell + 6]
+                    idx += 1
+            self._zobrist = h
+        return self._zobrist
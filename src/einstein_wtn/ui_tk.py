@@ -2,12 +2,14 @@
 from __future__ import annotations
 
 import argparse
+import copy
 import os
 import random
 import sys
 import time
 import tkinter as tk
 import tkinter.font as tkfont
+from concurrent.futures import Future, ThreadPoolExecutor
 from tkinter import filedialog
 from tkinter import messagebox
 from tkinter import ttk
@@ -27,6 +29,13 @@ PHASE_NEED_DICE = "need_dice"
 PHASE_NEED_MOVE = "need_move"
 PHASE_GAME_OVER = "game_over"
 
+REFRESH_BOARD = 1
+REFRESH_UI = 2
+
+LOG_FLUSH_MS = 50
+AI_POLL_MS = 20
+LOG_FLUSH_LINES = 64
+
 AGENT_CHOICES = [
     ("human", None),
     ("opening-expecti", OpeningExpectiAgent),
@@ -34,6 +43,8 @@ AGENT_CHOICES = [
     ("heuristic", HeuristicAgent),
     ("random", RandomAgent),
 ]
+AGENT_BY_NAME = dict(AGENT_CHOICES)
+AGENT_LABELS = tuple(label for label, _ in AGENT_CHOICES)
 
 CELL_COLORS = {
     "empty": "#f5f5f5",
@@ -45,6 +56,21 @@ CELL_COLORS = {
     "legal": "#81c784",
 }
 
+# (text, text colour, fill) per board value, indexed directly by the value: 1..6 are Red pieces,
+# negative indices -1..-6 land on the Blue entries at the end.
+PIECE_STYLE: Tuple[Tuple[str, str, str], ...] = tuple(
+    ("", "#444444", CELL_COLORS["empty"])
+    if value == 0
+    else (f"R{value}", CELL_COLORS["red_border"], CELL_COLORS["red"])
+    if value > 0
+    else (f"B{-value}", CELL_COLORS["blue_border"], CELL_COLORS["blue"])
+    for value in (*range(0, 7), *range(-6, 0))
+)
+START_CELL_FILL: Dict[Tuple[int, int], str] = {
+    **{rc: CELL_COLORS["red"] for rc in engine.START_RED_CELLS},
+    **{rc: CELL_COLORS["blue"] for rc in engine.START_BLUE_CELLS},
+}
+
 FONT_CANDIDATES = [
     "Noto Sans CJK SC",
     "Noto Sans CJK",
@@ -54,10 +80,60 @@ FONT_CANDIDATES = [
 ]
 CJK_FONT_CANDIDATES = FONT_CANDIDATES[:-1]
 
+# Widgets whose ``text`` is a plain translation: (attribute name, i18n key).
+RETEXT_TARGETS: Tuple[Tuple[str, str], ...] = (
+    ("title_label", "window_title"),
+    ("language_label", "language_label"),
+    ("game_frame", "game_group"),
+    ("play_frame", "play_agents_group"),
+    ("dice_frame", "dice_group"),
+    ("move_frame", "move_group"),
+    ("layout_frame", "layout_group"),
+    ("log_frame", "move_log"),
+    ("new_game_button", "new_game"),
+    ("save_wtn_button", "save_wtn"),
+    ("red_agent_label", "red_agent"),
+    ("blue_agent_label", "blue_agent"),
+    ("red_layout_label", "layouts_red"),
+    ("blue_layout_label", "layouts_blue"),
+    ("red_layout_text_label", "layout_wtn_red"),
+    ("blue_layout_text_label", "layout_wtn_blue"),
+    ("apply_layout_button", "apply_layout"),
+    ("new_game_layout_button", "new_game_layout"),
+    ("edit_toggle", "edit_layout_mode"),
+    ("edit_side_label", "edit_side"),
+    ("edit_red_radio", "red_agent"),
+    ("edit_blue_radio", "blue_agent"),
+    ("edit_piece_label", "edit_piece"),
+    ("clear_piece_button", "clear_piece"),
+    ("clear_side_button", "clear_side"),
+    ("mirror_button", "mirror_layout"),
+    ("auto_fill_red_check", "auto_fill_red"),
+    ("auto_fill_blue_check", "auto_fill_blue"),
+    ("mode_play_radio", "mode_play"),
+    ("mode_advise_radio", "mode_advise"),
+    ("auto_apply_check", "auto_apply"),
+    ("roll_button", "roll_dice"),
+    ("apply_dice_button", "apply_dice"),
+    ("input_label", "enter_move"),
+    ("apply_text_button", "apply"),
+    ("ai_move_button", "ai_move"),
+    ("copy_last_button", "copy_last"),
+    ("phase_heading", "phase_label"),
+    ("next_heading", "next_step_label"),
+    ("turn_heading", "info_turn"),
+    ("dice_heading", "info_dice"),
+    ("can_move_heading", "info_can_move"),
+    ("last_move_heading", "info_last_move"),
+    ("ai_suggestion_heading", "info_ai_suggestion"),
+)
+
 
 class EinsteinTkApp:
     """Tkinter UI supporting play and move advising with bilingual text."""
 
+    _font_selection: Optional[Tuple[str, bool, int]] = None
+
     def __init__(self, lang: str = "zh") -> None:
         self.lang = lang if lang in available_langs() else "zh"
 
@@ -107,12 +183,18 @@ class EinsteinTkApp:
 
         self.turn_var = tk.StringVar(value=t("turn_label", self.lang).format(turn="RED"))
 
-        self.board_buttons: List[List[tk.Button]] = []
         self.selected: Optional[Tuple[int, int]] = None
         self._highlighted: Set[Tuple[int, int]] = set()
+        self._pending_refresh = 0
+        self._refresh_after: Optional[str] = None
 
         self.log_text = tk.Text(self.root, height=12, width=48, state=tk.DISABLED)
         self.log_text.configure(font=(font_family, base_size - 1))
+        self._log_buffer: List[str] = []
+        self._log_after: Optional[str] = None
+        # Searches run on one worker thread; the Tk thread polls the future and applies the result.
+        self._ai_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="einstein-ai")
+        self._ai_future: Optional[Future] = None
 
         self.controller = self._build_controller()
         self._layout_widgets(piece_font)
@@ -132,18 +214,20 @@ class EinsteinTkApp:
             self._set_status_text(" | ".join(contract_errors), level="error")
 
     def _configure_fonts(self) -> Tuple[str, bool, int]:
-        available_fonts = set(tkfont.families(self.root))
-        selected_family = next(
-            (family for family in FONT_CANDIDATES if family in available_fonts),
-            tkfont.nametofont("TkDefaultFont").actual().get("family", "TkDefaultFont"),
-        )
-        has_cjk_font = selected_family in CJK_FONT_CANDIDATES
+        # Font discovery lists every installed family through Tcl; resolve it once per process.
+        if EinsteinTkApp._font_selection is None:
+            default_actual = tkfont.nametofont("TkDefaultFont").actual()
+            available_fonts = set(tkfont.families(self.root))
+            family = next(
+                (family for family in FONT_CANDIDATES if family in available_fonts),
+                default_actual.get("family", "TkDefaultFont"),
+            )
+            EinsteinTkApp._font_selection = (family, family in CJK_FONT_CANDIDATES, default_actual.get("size", 11))
+        selected_family, has_cjk_font, base_size = EinsteinTkApp._font_selection
 
-        default_font = tkfont.nametofont("TkDefaultFont")
-        base_size = default_font.actual().get("size", 11)
-        tkfont.nametofont("TkDefaultFont").configure(family=selected_family, size=base_size)
-        tkfont.nametofont("TkTextFont").configure(family=selected_family, size=base_size)
-        tkfont.nametofont("TkFixedFont").configure(family=selected_family, size=base_size)
+        # Named fonts belong to the Tk interpreter, so each new root still needs them set.
+        for name in ("TkDefaultFont", "TkTextFont", "TkFixedFont"):
+            tkfont.nametofont(name).configure(family=selected_family, size=base_size)
 
         style = ttk.Style(self.root)
         style.configure(".", font=(selected_family, base_size))
@@ -169,10 +253,11 @@ class EinsteinTkApp:
         return GameController.parse_layout_override(stripped)
 
     def _build_agent(self, name: str):
-        for label, cls in AGENT_CHOICES:
-            if label == name:
-                return cls(seed=None) if cls is not None else None
-        raise ValueError(f"Unknown agent '{name}'")
+        try:
+            cls = AGENT_BY_NAME[name]
+        except KeyError:
+            raise ValueError(f"Unknown agent '{name}'") from None
+        return cls(seed=None) if cls is not None else None
 
     def _build_board_area(self, parent: ttk.Frame, piece_font) -> None:
         board_frame = ttk.Frame(parent, padding=6, borderwidth=1, relief=tk.SOLID)
@@ -181,25 +266,53 @@ class EinsteinTkApp:
         board_frame.grid_propagate(False)
         board_frame.configure(width=600, height=600)
         self._resize_after: Optional[str] = None
+        self._board_applied_size = 0
         board_frame.bind("<Configure>", self._on_board_area_resize)
-        for idx in range(engine.BOARD_SIZE):
-            board_frame.columnconfigure(idx, weight=1, uniform="board")
-            board_frame.rowconfigure(idx, weight=1, uniform="board")
+        board_frame.columnconfigure(0, weight=1)
+        board_frame.rowconfigure(0, weight=1)
+        # One canvas with a rectangle and a text item per cell instead of 25 buttons: a refresh
+        # only touches canvas items whose appearance changed, and clicks dispatch by coordinate.
+        canvas = tk.Canvas(board_frame, highlightthickness=0)
+        canvas.grid(row=0, column=0, sticky="nsew")
+        self.board_canvas = canvas
+        self._cell_px = 1
+        self._cell_rect_ids: List[List[int]] = []
+        self._cell_text_ids: List[List[int]] = []
+        self._cell_drawn: List[List[Optional[Tuple[str, str, str, str, int]]]] = []
         for r in range(engine.BOARD_SIZE):
-            row_buttons: List[tk.Button] = []
+            rect_row: List[int] = []
+            text_row: List[int] = []
             for c in range(engine.BOARD_SIZE):
-                btn = tk.Button(
-                    board_frame,
-                    text="",
-                    width=1,
-                    height=1,
-                    font=piece_font,
-                    relief=tk.RAISED,
-                    command=lambda rr=r, cc=c: self._on_square_click(rr, cc),
+                rect_row.append(canvas.create_rectangle(0, 0, 0, 0, tags=(f"cell:{r}:{c}",)))
+                text_row.append(
+                    canvas.create_text(0, 0, text="", font=piece_font, disabledfill="#a3a3a3", tags=(f"cell:{r}:{c}",))
                 )
-                btn.grid(row=r, column=c, padx=1, pady=1, sticky="nsew")
-                row_buttons.append(btn)
-            self.board_buttons.append(row_buttons)
+            self._cell_rect_ids.append(rect_row)
+            self._cell_text_ids.append(text_row)
+            self._cell_drawn.append([None] * engine.BOARD_SIZE)
+        canvas.bind("<Configure>", self._on_board_canvas_resize)
+        canvas.bind("<Button-1>", self._on_board_canvas_click)
+
+    def _on_board_canvas_resize(self, event) -> None:
+        cell = max(1, min(event.width, event.height) // engine.BOARD_SIZE)
+        if cell == self._cell_px:
+            return
+        self._cell_px = cell
+        canvas = self.board_canvas
+        for r in range(engine.BOARD_SIZE):
+            y0 = r * cell
+            for c in range(engine.BOARD_SIZE):
+                x0 = c * cell
+                canvas.coords(self._cell_rect_ids[r][c], x0 + 2, y0 + 2, x0 + cell - 2, y0 + cell - 2)
+                canvas.coords(self._cell_text_ids[r][c], x0 + cell // 2, y0 + cell // 2)
+
+    def _on_board_canvas_click(self, event) -> None:
+        if str(self.board_canvas.cget("state")) == tk.DISABLED:
+            return
+        r = event.y // self._cell_px
+        c = event.x // self._cell_px
+        if 0 <= r < engine.BOARD_SIZE and 0 <= c < engine.BOARD_SIZE:
+            self._on_square_click(r, c)
 
     def _build_control_panel(self, parent: ttk.Frame, piece_font) -> None:
         control_container = ttk.Frame(parent, padding=(0, 0, 0, 0))
@@ -257,7 +370,7 @@ class EinsteinTkApp:
             agents_frame,
             self.agent_var_red,
             self.agent_var_red.get(),
-            *[label for label, _ in AGENT_CHOICES],
+            *AGENT_LABELS,
             command=lambda *_: self._on_agents_changed(),
         )
         self.cb_red_agent.grid(row=0, column=1, sticky="ew", padx=6, pady=2)
@@ -267,7 +380,7 @@ class EinsteinTkApp:
             agents_frame,
             self.agent_var_blue,
             self.agent_var_blue.get(),
-            *[label for label, _ in AGENT_CHOICES],
+            *AGENT_LABELS,
             command=lambda *_: self._on_agents_changed(),
         )
         self.cb_blue_agent.grid(row=1, column=1, sticky="ew", padx=6, pady=2)
@@ -518,7 +631,9 @@ class EinsteinTkApp:
         status_frame.columnconfigure(9, weight=1)
         self.phase_heading = ttk.Label(status_frame, text=t("phase_label", self.lang), font=("TkDefaultFont", 11, "bold"))
         self.phase_heading.grid(row=0, column=0, sticky="w")
-        self.phase_value = ttk.Label(status_frame, textvariable=self.phase_var)
+        # Labels rewritten on every move get a fixed width so a new value does not make the
+        # status grid re-measure its columns.
+        self.phase_value = ttk.Label(status_frame, textvariable=self.phase_var, width=10)
         self.phase_value.grid(row=0, column=1, sticky="w", padx=(4, 12))
         self.next_heading = ttk.Label(status_frame, text=t("next_step_label", self.lang), font=("TkDefaultFont", 11, "bold"))
         self.next_heading.grid(row=0, column=2, sticky="w")
@@ -527,12 +642,14 @@ class EinsteinTkApp:
 
         self.turn_heading = ttk.Label(status_frame, text=t("info_turn", self.lang))
         self.turn_heading.grid(row=1, column=0, sticky="w")
-        self.turn_label = ttk.Label(status_frame, textvariable=self.turn_var, font=("TkDefaultFont", 11, "bold"))
+        self.turn_label = ttk.Label(
+            status_frame, textvariable=self.turn_var, font=("TkDefaultFont", 11, "bold"), width=12
+        )
         self.turn_label.grid(row=1, column=1, sticky="w", padx=(4, 12))
         self.dice_heading = ttk.Label(status_frame, text=t("info_dice", self.lang))
         self.dice_heading.grid(row=1, column=2, sticky="w")
         self.dice_value_var = tk.StringVar(value=t("dice_label", self.lang).format(dice="-"))
-        self.dice_label = ttk.Label(status_frame, textvariable=self.dice_value_var)
+        self.dice_label = ttk.Label(status_frame, textvariable=self.dice_value_var, width=8)
         self.dice_label.grid(row=1, column=3, sticky="w", padx=(4, 12))
         self.can_move_heading = ttk.Label(status_frame, text=t("info_can_move", self.lang))
         self.can_move_heading.grid(row=1, column=4, sticky="w")
@@ -540,7 +657,7 @@ class EinsteinTkApp:
         self.can_move_label.grid(row=1, column=5, sticky="w", padx=(4, 12))
         self.last_move_heading = ttk.Label(status_frame, text=t("info_last_move", self.lang))
         self.last_move_heading.grid(row=1, column=6, sticky="w")
-        self.last_move_label = ttk.Label(status_frame, textvariable=self.last_move_var)
+        self.last_move_label = ttk.Label(status_frame, textvariable=self.last_move_var, width=12)
         self.last_move_label.grid(row=1, column=7, sticky="w", padx=(4, 12))
         self.status_label = ttk.Label(status_frame, textvariable=self.status_var)
         self.status_label.grid(row=1, column=8, columnspan=2, sticky="ew")
@@ -686,14 +803,14 @@ class EinsteinTkApp:
             agent_defaults,
             self.default_agent_red,
             self.default_agent_red.get(),
-            *[label for label, _ in AGENT_CHOICES],
+            *AGENT_LABELS,
         ).grid(row=0, column=1, sticky="ew", padx=(6, 0))
         ttk.Label(agent_defaults, text="Blue").grid(row=1, column=0, sticky="w", pady=(6, 0))
         ttk.OptionMenu(
             agent_defaults,
             self.default_agent_blue,
             self.default_agent_blue.get(),
-            *[label for label, _ in AGENT_CHOICES],
+            *AGENT_LABELS,
         ).grid(row=1, column=1, sticky="ew", padx=(6, 0), pady=(6, 0))
 
     def _build_help_screen(self) -> None:
@@ -863,6 +980,10 @@ class EinsteinTkApp:
         else:
             cell = max(24, raw_cell)
         board_size = cell * engine.BOARD_SIZE
+        # Resizing the frame fires <Configure> again; an unchanged size ends that loop here.
+        if board_size == self._board_applied_size:
+            return
+        self._board_applied_size = board_size
         self.board_frame.configure(width=board_size, height=board_size)
         self.board_frame.update_idletasks()
 
@@ -927,59 +1048,13 @@ class EinsteinTkApp:
 
     def _refresh_texts(self) -> None:
         self.root.title(t("window_title", self.lang))
-        self.title_label.configure(text=t("window_title", self.lang))
-        self.language_label.configure(text=t("language_label", self.lang))
         self.language_combo.configure(values=available_langs())
-        for frame, label in [
-            (self.game_frame, "game_group"),
-            (self.play_frame, "play_agents_group"),
-            (self.dice_frame, "dice_group"),
-            (self.move_frame, "move_group"),
-            (self.layout_frame, "layout_group"),
-            (self.log_frame, "move_log"),
-        ]:
-            frame.configure(text=t(label, self.lang))
-        self.new_game_button.configure(text=t("new_game", self.lang))
-        self.save_wtn_button.configure(text=t("save_wtn", self.lang))
-        self.red_agent_label.configure(text=t("red_agent", self.lang))
-        self.blue_agent_label.configure(text=t("blue_agent", self.lang))
-        self.red_layout_label.configure(text=t("layouts_red", self.lang))
-        self.blue_layout_label.configure(text=t("layouts_blue", self.lang))
-        self.red_layout_text_label.configure(text=t("layout_wtn_red", self.lang))
-        self.blue_layout_text_label.configure(text=t("layout_wtn_blue", self.lang))
-        self.apply_layout_button.configure(text=t("apply_layout", self.lang))
-        self.new_game_layout_button.configure(text=t("new_game_layout", self.lang))
-        self.edit_toggle.configure(text=t("edit_layout_mode", self.lang))
-        self.edit_side_label.configure(text=t("edit_side", self.lang))
-        self.edit_red_radio.configure(text=t("red_agent", self.lang))
-        self.edit_blue_radio.configure(text=t("blue_agent", self.lang))
-        self.edit_piece_label.configure(text=t("edit_piece", self.lang))
-        self.clear_piece_button.configure(text=t("clear_piece", self.lang))
-        self.clear_side_button.configure(text=t("clear_side", self.lang))
-        self.mirror_button.configure(text=t("mirror_layout", self.lang))
-        self.auto_fill_red_check.configure(text=t("auto_fill_red", self.lang))
-        self.auto_fill_blue_check.configure(text=t("auto_fill_blue", self.lang))
-        self.mode_play_radio.configure(text=t("mode_play", self.lang))
-        self.mode_advise_radio.configure(text=t("mode_advise", self.lang))
-        self.auto_apply_check.configure(text=t("auto_apply", self.lang))
-        self.roll_button.configure(text=t("roll_dice", self.lang))
-        self.apply_dice_button.configure(text=t("apply_dice", self.lang))
-        self.input_label.configure(text=t("enter_move", self.lang))
-        self.apply_text_button.configure(text=t("apply", self.lang))
-        self.ai_move_button.configure(text=t("ai_move", self.lang))
-        self.copy_last_button.configure(text=t("copy_last", self.lang))
-        self.phase_heading.configure(text=t("phase_label", self.lang))
-        self.next_heading.configure(text=t("next_step_label", self.lang))
-        self.turn_heading.configure(text=t("info_turn", self.lang))
-        self.dice_heading.configure(text=t("info_dice", self.lang))
-        self.can_move_heading.configure(text=t("info_can_move", self.lang))
-        self.last_move_heading.configure(text=t("info_last_move", self.lang))
-        self.ai_suggestion_heading.configure(text=t("info_ai_suggestion", self.lang))
+        for attr, key in RETEXT_TARGETS:
+            getattr(self, attr).configure(text=t(key, self.lang))
         self.turn_var.set(t("turn_label", self.lang).format(turn=self.controller.state.turn.name))
         self.dice_value_var.set(t("dice_label", self.lang).format(dice=self.dice_var.get()))
         self.phase_var.set(t(f"phase_{self._phase}", self.lang))
         self.next_step_var.set(t(f"next_step_{self._phase}", self.lang))
-        self.log_frame.configure(text=t("move_log", self.lang))
         if not self.controller.history:
             self.last_move_var.set(t("no_last_move", self.lang))
         else:
@@ -999,8 +1074,7 @@ class EinsteinTkApp:
     def _on_language_changed(self) -> None:
         self.lang = self.lang_var.get()
         self._refresh_texts()
-        self._refresh_board()
-        self._refresh_ui_state()
+        self._schedule_refresh(REFRESH_BOARD | REFRESH_UI)
 
     def _apply_status(self, text: str, level: str) -> None:
         color_map = {
@@ -1095,7 +1169,22 @@ class EinsteinTkApp:
             return
         self._set_status_key(key, level=level)
 
+    def _schedule_refresh(self, what: int) -> None:
+        """Queue a board and/or UI-state refresh; a burst of requests repaints once when idle."""
+        self._pending_refresh |= what
+        if self._refresh_after is None:
+            self._refresh_after = self.root.after_idle(self._do_pending_refresh)
+
+    def _do_pending_refresh(self) -> None:
+        self._refresh_after = None
+        pending = self._pending_refresh
+        if pending & REFRESH_BOARD:
+            self._refresh_board()
+        if pending & REFRESH_UI:
+            self._refresh_ui_state()
+
     def _refresh_ui_state(self) -> None:
+        self._pending_refresh &= ~REFRESH_UI
         phase = self._update_phase()
         self._board_block_reason = None
         dice_enabled = phase == PHASE_NEED_DICE
@@ -1131,6 +1220,13 @@ class EinsteinTkApp:
             dice_reason = reason_key
             move_reason = reason_key
 
+        if self._ai_future is not None and phase == PHASE_NEED_MOVE:
+            # A background search owns this turn until its result is applied or dropped.
+            board_enabled = False
+            move_enabled = False
+            ai_enabled = False
+            reason_key = "ai_thinking"
+
         if phase == PHASE_NEED_MOVE:
             hint_level = "info"
         block_reason = reason_key or move_reason or dice_reason
@@ -1143,9 +1239,7 @@ class EinsteinTkApp:
         self._set_widget_state(self.ai_move_button, move_enabled and ai_enabled)
         self._set_widget_state(self.copy_last_button, phase != PHASE_SETUP)
 
-        for row in self.board_buttons:
-            for btn in row:
-                self._set_widget_state(btn, board_enabled or self.edit_mode_var.get())
+        self._set_widget_state(self.board_canvas, board_enabled or self.edit_mode_var.get())
 
         self._maybe_hint(block_reason, level=hint_level)
 
@@ -1172,7 +1266,7 @@ class EinsteinTkApp:
         self.selected = None
         self._clear_highlights()
         self.edit_mode_var.set(False)
-        self._refresh_board()
+        self._schedule_refresh(REFRESH_BOARD)
         self.last_move_var.set(t("no_last_move", self.lang))
         self.ai_suggestion_var.set(t("no_last_move", self.lang))
         self._ai_suggestion_empty = True
@@ -1237,7 +1331,7 @@ class EinsteinTkApp:
         self.selected = None
         self._clear_highlights()
         self.edit_mode_var.set(False)
-        self._refresh_board()
+        self._schedule_refresh(REFRESH_BOARD)
         self.last_move_var.set(t("no_last_move", self.lang))
         self.ai_suggestion_var.set(t("no_last_move", self.lang))
         self._ai_suggestion_empty = True
@@ -1351,12 +1445,43 @@ class EinsteinTkApp:
         if agent is None:
             self._set_status_key("human_turn")
             return
-        self._set_status_key("ai_thinking", level="info")
-        self.root.update_idletasks()
-        self.root.after(10, lambda: self._do_ai_move(apply_move))
+        self._do_ai_move(apply_move)
 
     def _do_ai_move(self, apply_move: bool) -> None:
-        move = self.controller.compute_ai_move(time_budget_ms=200)
+        if self._ai_future is not None:
+            return
+        self._set_status_key("ai_thinking", level="info")
+        controller = self.controller
+        position = (controller.state, controller.dice)
+        # The search applies and undoes moves in place, so it gets its own copy of the state
+        # while the Tk thread keeps rendering the live one.
+        snapshot = copy.copy(controller)
+        snapshot.state = controller.state.clone()
+        self._ai_future = self._ai_executor.submit(snapshot.compute_ai_move, 200)
+        self._refresh_ui_state()
+        self.root.after(AI_POLL_MS, self._poll_ai_move, controller, position, apply_move)
+
+    def _poll_ai_move(self, controller: GameController, position, apply_move: bool) -> None:
+        future = self._ai_future
+        if future is None:
+            return
+        if not future.done():
+            self.root.after(AI_POLL_MS, self._poll_ai_move, controller, position, apply_move)
+            return
+        self._ai_future = None
+        # Drop results for a position that changed while searching (new game, manual move).
+        state, dice = position
+        if controller is not self.controller or controller.state is not state or controller.dice != dice:
+            self._refresh_ui_state()
+            # The position moved on while searching; start the AI on the new one if it is due.
+            self._maybe_auto_step_ai()
+            return
+        exc = future.exception()
+        if exc is not None:
+            self._refresh_ui_state()
+            self._set_status_text(t("status_error_prefix", self.lang).format(msg=exc), level="error")
+            return
+        move = future.result()
         if apply_move:
             self.controller._apply_move(move)
             self._after_move(move)
@@ -1473,18 +1598,16 @@ class EinsteinTkApp:
     def _on_toggle_edit_mode(self) -> None:
         self.selected = None
         self._clear_highlights()
-        self._refresh_board()
         if self.edit_mode_var.get():
             self._set_status_key("layout_edit_on")
         else:
             self._set_status_key("status_ready")
-        self._refresh_ui_state()
+        self._schedule_refresh(REFRESH_BOARD | REFRESH_UI)
 
     def _on_edit_side(self) -> None:
         """Handle layout edit side changes without disrupting the UI."""
         self.selected = None
         self._clear_highlights()
-        self._refresh_board()
         if self.edit_mode_var.get():
             self._set_status_key("layout_edit_on")
         else:
@@ -1517,7 +1640,7 @@ class EinsteinTkApp:
             t("layout_piece_set", self.lang).format(color=side, piece=piece_id, square=rc_to_sq(r, c)),
             level="success",
         )
-        self._refresh_board()
+        self._schedule_refresh(REFRESH_BOARD)
 
     def _clear_selected_piece(self) -> None:
         side = self.edit_side_var.get()
@@ -1529,13 +1652,13 @@ class EinsteinTkApp:
         if piece_id in self.edit_layouts[side]:
             self.edit_layouts[side].pop(piece_id, None)
             self._set_status_text(t("layout_piece_cleared", self.lang), level="info")
-            self._refresh_board()
+            self._schedule_refresh(REFRESH_BOARD)
 
     def _clear_side(self) -> None:
         side = self.edit_side_var.get()
         self.edit_layouts[side].clear()
         self._set_status_text(t("layout_side_cleared", self.lang), level="info")
-        self._refresh_board()
+        self._schedule_refresh(REFRESH_BOARD)
 
     def _mirror_layout(self) -> None:
         if not self.edit_layouts["R"]:
@@ -1553,7 +1676,7 @@ class EinsteinTkApp:
             return
         self.edit_layouts["B"] = mirrored
         self._set_status_key("layout_mirrored", level="success")
-        self._refresh_board()
+        self._schedule_refresh(REFRESH_BOARD)
 
     def _after_move(self, move: Move) -> None:
         move_text = self._format_move(move)
@@ -1565,8 +1688,6 @@ class EinsteinTkApp:
             )
         )
         self._log(move_text)
-        self._refresh_board()
-        self._update_turn()
         self._clear_highlights()
         self._set_status_key("status_move_applied", level="success")
         self._refresh_ui_state()
@@ -1584,17 +1705,7 @@ class EinsteinTkApp:
             return
         if self.controller.dice is None:
             return
-        if self.mode_var.get() == "play" or self.auto_apply_var.get():
-            move = self.controller.step_ai(time_budget_ms=200)
-            self._after_move(move)
-            self._set_status_key("status_applied_advice", level="success")
-        else:
-            move = self.controller.compute_ai_move(time_budget_ms=200)
-            text = t("advised_move", self.lang).format(move=self._format_move(move))
-            self.ai_suggestion_var.set(text)
-            self._ai_suggestion_empty = False
-            self._log(text)
-            self._set_status_text(text)
+        self._do_ai_move(self.mode_var.get() == "play" or self.auto_apply_var.get())
 
     def _find_move(self, from_rc: Tuple[int, int], to_rc: Tuple[int, int]) -> Optional[Move]:
         try:
@@ -1612,83 +1723,57 @@ class EinsteinTkApp:
 
     def _clear_highlights(self) -> None:
         self._highlighted.clear()
-        self._reapply_highlights()
+        self._schedule_refresh(REFRESH_BOARD)
 
     def _highlight_selection(
         self, destinations: Set[Tuple[int, int]], origin: Tuple[int, int]
     ) -> None:
         self._highlighted = set(destinations)
         self.selected = origin
-        self._reapply_highlights()
+        self._schedule_refresh(REFRESH_BOARD)
 
     def _reapply_highlights(self) -> None:
-        if self.edit_mode_var.get():
-            for r in range(engine.BOARD_SIZE):
-                for c in range(engine.BOARD_SIZE):
-                    self._render_cell(r, c)
-            return
+        editing = self.edit_mode_var.get()
         for r in range(engine.BOARD_SIZE):
             for c in range(engine.BOARD_SIZE):
-                self._render_cell(r, c)
-                btn = self.board_buttons[r][c]
-                if self.selected == (r, c):
-                    btn.configure(
-                        relief=tk.SUNKEN,
-                        highlightthickness=3,
-                        highlightbackground=CELL_COLORS["highlight"],
-                        highlightcolor=CELL_COLORS["highlight"],
-                    )
-                elif (r, c) in self._highlighted:
-                    btn.configure(
-                        highlightthickness=3,
-                        highlightbackground=CELL_COLORS["legal"],
-                        highlightcolor=CELL_COLORS["legal"],
-                    )
-
-    def _render_cell(self, r: int, c: int) -> None:
-        btn = self.board_buttons[r][c]
+                outline = "#9e9e9e"
+                width = 1
+                if not editing:
+                    if self.selected == (r, c):
+                        outline = CELL_COLORS["highlight"]
+                        width = 3
+                    elif (r, c) in self._highlighted:
+                        outline = CELL_COLORS["legal"]
+                        width = 3
+                self._render_cell(r, c, outline, width)
+
+    def _render_cell(self, r: int, c: int, outline: str = "#9e9e9e", width: int = 1) -> None:
         if self.edit_mode_var.get():
             text = ""
-            bg = CELL_COLORS["empty"]
             fg = "#444444"
-            if (r, c) in self.red_start_cells:
-                bg = CELL_COLORS["red"]
-            elif (r, c) in self.blue_start_cells:
-                bg = CELL_COLORS["blue"]
+            bg = START_CELL_FILL.get((r, c), CELL_COLORS["empty"])
             for color, layout in self.edit_layouts.items():
                 for pid, coord in layout.items():
                     if coord == (r, c):
-                        text = f"{color}{pid}"
-                        fg = CELL_COLORS["red_border"] if color == "R" else CELL_COLORS["blue_border"]
-                        bg = CELL_COLORS["red"] if color == "R" else CELL_COLORS["blue"]
+                        text, fg, bg = PIECE_STYLE[pid if color == "R" else -pid]
                         break
-            btn.configure(
-                text=text,
-                background=bg,
-                activebackground=bg,
-                foreground=fg,
-                relief=tk.RAISED,
-                highlightthickness=0,
-            )
+        else:
+            text, fg, bg = PIECE_STYLE[self.controller.state.board[r][c]]
+        appearance = (text, fg, bg, outline, width)
+        drawn = self._cell_drawn[r][c]
+        if drawn == appearance:
             return
-        val = self.controller.state.board[r][c]
-        text = ""
-        bg = CELL_COLORS["empty"]
-        fg = "#444444"
-        if val > 0:
-            text = f"R{val}"
-            bg = CELL_COLORS["red"]
-            fg = CELL_COLORS["red_border"]
-        elif val < 0:
-            text = f"B{abs(val)}"
-            bg = CELL_COLORS["blue"]
-            fg = CELL_COLORS["blue_border"]
-        btn.configure(text=text, background=bg, activebackground=bg, foreground=fg, relief=tk.RAISED, highlightthickness=0)
+        self._cell_drawn[r][c] = appearance
+        # Only reconfigure the item whose options changed: a move usually restyles the text of
+        # two cells, a selection only the rectangle outlines.
+        if drawn is None or drawn[2:] != appearance[2:]:
+            self.board_canvas.itemconfigure(self._cell_rect_ids[r][c], fill=bg, outline=outline, width=width)
+        if drawn is None or drawn[:2] != appearance[:2]:
+            self.board_canvas.itemconfigure(self._cell_text_ids[r][c], text=text, fill=fg)
 
     def _refresh_board(self) -> None:
-        for r in range(engine.BOARD_SIZE):
-            for c in range(engine.BOARD_SIZE):
-                self._render_cell(r, c)
+        # Draws every cell together with its selection ring; unchanged cells are skipped.
+        self._pending_refresh &= ~REFRESH_BOARD
         self._reapply_highlights()
         self._update_turn()
         self._update_move_hints()
@@ -1745,10 +1830,25 @@ class EinsteinTkApp:
         return f"{mover.name} dice={dice_value}: {move.piece_id} {rc_to_sq(from_r, from_c)}->{rc_to_sq(to_r, to_c)}"
 
     def _log(self, msg: str) -> None:
+        # Lines are buffered and written in one insert so bursts (AI self-play) reflow the
+        # Text widget once per flush rather than once per move.
+        self._log_buffer.append(msg + "\n")
+        if len(self._log_buffer) >= LOG_FLUSH_LINES:
+            self._flush_log()
+        elif self._log_after is None:
+            self._log_after = self.root.after(LOG_FLUSH_MS, self._flush_log)
+
+    def _flush_log(self) -> None:
+        if self._log_after is not None:
+            self.root.after_cancel(self._log_after)
+            self._log_after = None
+        if not self._log_buffer:
+            return
         self.log_text.config(state=tk.NORMAL)
-        self.log_text.insert(tk.END, msg + "\n")
+        self.log_text.insert(tk.END, "".join(self._log_buffer))
         self.log_text.config(state=tk.DISABLED)
         self.log_text.see(tk.END)
+        self._log_buffer.clear()
 
     def _is_ai_turn(self) -> bool:
         agent = self.controller.red_agent if self.controller.state.turn is Player.RED else self.controller.blue_agent
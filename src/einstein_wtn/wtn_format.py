@@ -6,11 +6,15 @@ used for recording layouts and move sequences.
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, List, Tuple
+from typing import Dict, List, Sequence, Tuple
 
 COLUMNS = "ABCDE"
 ROWS = "12345"
 
+# Display strings indexed directly by board cell value: 0 empty, +k Red piece k, and -k Blue
+# piece k via negative indexing (the tail runs B6..B1), so no offset or branch per cell.
+_CELL_STR: Tuple[str, ...] = (" . ",) + tuple(f"R{v}" for v in range(1, 7)) + tuple(f"B{v}" for v in range(6, 0, -1))
+
 
 def rc_to_sq(r: int, c: int) -> str:
     """Convert 0-based row/col to WTN square string (e.g., 0,0 -> "A1")."""
@@ -20,6 +24,13 @@ def rc_to_sq(r: int, c: int) -> str:
     return f"{COLUMNS[c]}{ROWS[r]}"
 
 
+def format_board(board: Sequence[Sequence[int]]) -> str:
+    """Render a 5x5 board as text rows (``R3``/``B5`` for pieces, `` . `` for empty)."""
+
+    # List comprehensions rather than generators: str.join builds a list first anyway.
+    return "\n".join([" ".join([_CELL_STR[cell] for cell in row]) for row in board])
+
+
 def sq_to_rc(sq: str) -> Tuple[int, int]:
     """Convert WTN square string (e.g., "C3") to 0-based row/col."""
 
@@ -128,7 +139,9 @@ def parse_wtn(text: str) -> WTNGame:
     return WTNGame(comments=comments, red_layout=red_layout, blue_layout=blue_layout, moves=moves)
 
 
-def _dump_layout(layout: Dict[int, Tuple[int, int]], color: str) -> str:
+def dump_layout_line(layout: Dict[int, Tuple[int, int]], color: str) -> str:
+    """Serialize one side's layout as an ``R:``/``B:`` line (no trailing newline)."""
+
     parts: List[str] = []
     for pid in sorted(layout):
         r, c = layout[pid]
@@ -136,13 +149,19 @@ def _dump_layout(layout: Dict[int, Tuple[int, int]], color: str) -> str:
     return f"{color}:{';'.join(parts)}"
 
 
+def dump_move_line(ply: int, dice: int, color: str, pid: int, to_r: int, to_c: int) -> str:
+    """Serialize one move as ``ply:dice;(Cpid,SQ)`` (no trailing newline)."""
+
+    return f"{ply}:{dice};({color}{pid},{rc_to_sq(to_r, to_c)})"
+
+
 def dump_wtn(game: WTNGame) -> str:
     """Serialize a ``WTNGame`` to text."""
 
     lines: List[str] = []
     lines.extend(game.comments)
-    lines.append(_dump_layout(game.red_layout, "R"))
-    lines.append(_dump_layout(game.blue_layout, "B"))
-    for ply, dice, color, pid, to_r, to_c in game.moves:
-        lines.append(f"{ply}:{dice};({color}{pid},{rc_to_sq(to_r, to_c)})")
+    lines.append(dump_layout_line(game.red_layout, "R"))
+    lines.append(dump_layout_line(game.blue_layout, "B"))
+    for move in game.moves:
+        lines.append(dump_move_line(*move))
     return "\n".join(lines) + "\n"
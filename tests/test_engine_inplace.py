@@ -29,3 +29,24 @@ def test_inplace_apply_undo_roundtrip():
     assert state.alive_red == original_alive_red
     assert state.alive_blue == original_alive_blue
     assert state.key() == original_key
+
+
+def test_incremental_zobrist_matches_fresh_hash():
+    state = engine.new_game(engine.START_RED_CELLS, engine.START_BLUE_CELLS, first=Player.RED)
+    original_hash = state.zobrist()
+    dice_seq = [6, 1, 3, 2, 5, 4, 1, 6, 2, 3]
+    undos = []
+    copied = state
+    for dice in dice_seq:
+        move = engine.generate_legal_moves(state, dice)[-1]
+        copied = engine.apply_move(copied, move)
+        undos.append(engine.apply_move_inplace(state, move))
+        fresh = state.clone()
+        fresh._zobrist = None
+        assert state.zobrist() == fresh.zobrist() == copied.zobrist()
+        if engine.is_terminal(state):
+            break
+
+    while undos:
+        engine.undo_move_inplace(state, undos.pop())
+    assert state.zobrist() == original_hash
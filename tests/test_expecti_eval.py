@@ -1,3 +1,5 @@
+import time
+
 from einstein_wtn import engine
 from einstein_wtn.agents import ExpectiminimaxAgent
 from einstein_wtn.types import GameState, Move, Player
@@ -153,3 +155,80 @@ def test_tt_bestmove_promoted_in_child_decision():
 
     promoted = agent._promote_tt_best_move_first(moves, agent._ttable[key])
     assert promoted[0] == pv_move
+
+
+def test_tt_persists_across_moves_until_reset():
+    state = build_state(red_map={1: (0, 0), 2: (1, 0)}, blue_map={1: (4, 4), 2: (3, 4)}, turn=Player.RED)
+    agent = ExpectiminimaxAgent(max_depth=2, seed=11)
+
+    agent.choose_move(state, dice=1)
+    stored = len(agent._ttable)
+    assert stored > 0
+
+    agent.choose_move(state, dice=1)
+    assert agent.last_stats is not None and agent.last_stats.tt_hits > 0
+
+    agent.reset_tt()
+    assert agent._ttable == {}
+
+
+def test_tt_trimmed_to_cap_oldest_first():
+    agent = ExpectiminimaxAgent(seed=12, tt_max_entries=3)
+    for idx in range(5):
+        agent._ttable[("D", idx)] = agent.TTEntry(value=0.0, depth=1, bound=agent.Bound.EXACT)
+
+    agent._trim_tt()
+
+    assert list(agent._ttable) == [("D", 2), ("D", 3), ("D", 4)]
+
+
+def test_parallel_root_matches_sequential_choice():
+    state = engine.new_game(list(engine.START_RED_CELLS), list(engine.START_BLUE_CELLS))
+    parallel = ExpectiminimaxAgent(max_depth=2, seed=13, parallel_root=2)
+    try:
+        for dice in (1, 4, 6):
+            sequential = ExpectiminimaxAgent(max_depth=2, seed=13)
+            assert parallel.choose_move(state, dice) == sequential.choose_move(state, dice)
+            assert parallel.last_stats.depth_reached == 2
+    finally:
+        parallel.close_root_pool()
+
+
+def test_parallel_root_respects_budget_with_more_moves_than_workers():
+    state = engine.new_game(list(engine.START_RED_CELLS), list(engine.START_BLUE_CELLS))
+    agent = ExpectiminimaxAgent(max_depth=30, seed=3, parallel_root=2)
+    try:
+        assert len(engine.generate_legal_moves(state, 1)) > agent.parallel_root
+        agent.choose_move(state, 1, time_budget_ms=50)  # Start the worker pool outside the timing.
+        start = time.monotonic()
+        move = agent.choose_move(state, 1, time_budget_ms=300)
+        elapsed_ms = (time.monotonic() - start) * 1000
+        assert move in engine.generate_legal_moves(state, 1)
+        assert elapsed_ms < 450
+    finally:
+        agent.close_root_pool()
+
+
+def test_narrow_window_chance_values_are_not_reused_as_exact():
+    state = engine.new_game(engine.START_RED_CELLS, engine.START_BLUE_CELLS, first=Player.RED)
+    inf = float("inf")
+    expected = ExpectiminimaxAgent(max_depth=3, seed=0)._search_chance(state, 3, Player.RED, None, 0, -inf, inf)
+
+    agent = ExpectiminimaxAgent(max_depth=3, seed=0)
+    agent._search_chance(state, 3, Player.RED, None, 0, -6.0, -5.0)
+    assert agent._search_chance(state, 3, Player.RED, None, 0, -inf, inf) == expected
+
+
+def test_parallel_root_ignores_moves_that_finished_no_depth():
+    state = engine.new_game(list(engine.START_RED_CELLS), list(engine.START_BLUE_CELLS))
+    moves = engine.generate_legal_moves(state, 1)[:3]
+    results = [([0.5, 0.2], 10, 0, 0), ([], 1, 0, 0), ([0.1, 0.4], 10, 0, 0)]
+
+    class FakePool:
+        def map(self, fn, *iterables):
+            return iter(results)
+
+    agent = ExpectiminimaxAgent(max_depth=4, seed=0, parallel_root=2)
+    agent._root_pool = FakePool()
+    assert agent._choose_root_parallel(state, moves, None) == moves[2]
+    assert agent._depth_reached == 2
@@ -44,3 +44,16 @@ def test_to_wtn_roundtrip_parses():
     game = parse_wtn(text)
     assert game.red_layout and game.blue_layout
     assert len(game.moves) == 2
+
+
+def test_to_wtn_tracks_colors_when_blue_starts():
+    controller = GameController(
+        red_agent=HeuristicAgent(seed=5), blue_agent=HeuristicAgent(seed=6), first=Player.BLUE
+    )
+    controller.set_dice(3)
+    controller.step_ai(time_budget_ms=10)
+    controller.set_dice(4)
+    controller.step_ai(time_budget_ms=10)
+
+    game = parse_wtn(controller.to_wtn())
+    assert [(ply, dice, color) for ply, dice, color, *_ in game.moves] == [(1, 3, "B"), (2, 4, "R")]
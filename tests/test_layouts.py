@@ -67,3 +67,15 @@ def test_runner_layout_parse():
 
     with pytest.raises(ValueError):
         runner.parse_layout_string("1,1,2,3,4,5")
+
+
+def test_arrangement_identity_order_uses_start_cells():
+    for cells in (engine.START_RED_CELLS, engine.START_BLUE_CELLS):
+        assert runner.arrangement_to_layout([1, 2, 3, 4, 5, 6], cells) == list(cells)
+        assert runner.arrangement_to_layout((1, 2, 3, 4, 5, 6), cells) == list(cells)
+
+
+def test_arrangement_rejects_non_permutation():
+    for order in ([1, 1, 2, 3, 4, 5], [0, 1, 2, 3, 4, 5], [1, 2, 3, 4, 5]):
+        with pytest.raises(ValueError):
+            runner.arrangement_to_layout(order, engine.START_RED_CELLS)
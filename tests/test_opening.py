@@ -26,3 +26,18 @@ def test_layoutsearch_budget_respected():
     elapsed_ms = (time.monotonic() - start) * 1000
     assert len(layout) == 6
     assert elapsed_ms < 100
+
+
+def test_layoutsearch_reuses_result_for_same_budget(monkeypatch):
+    agent = LayoutSearchAgent(seed=5)
+    first = agent.choose_initial_layout(Player.BLUE, time_budget_ms=120)
+
+    def _fail(*_args, **_kwargs):
+        raise AssertionError("layout search should come from the cache")
+
+    monkeypatch.setattr("einstein_wtn.opening.score_layout", _fail)
+    assert agent.choose_initial_layout(Player.BLUE, time_budget_ms=120) == first
+    stats = agent.last_opening_stats
+    assert stats["cached"] is True
+    assert stats["evaluated_candidates"] == 0
+    assert stats["elapsed_ms"] == 0.0
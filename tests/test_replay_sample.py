@@ -11,3 +11,12 @@ def test_replay_sample_file():
 
     assert winner == Player.RED
     assert engine.winner(state) == winner
+
+
+def test_trusted_replay_matches_validated():
+    path = Path(__file__).parent / "data" / "sample.wtn.txt"
+    validated_state, validated_winner = replay.replay_file(str(path))
+    trusted_state, trusted_winner = replay.replay_file(str(path), validate=False)
+
+    assert trusted_winner == validated_winner
+    assert trusted_state.board == validated_state.board
@@ -0,0 +1,124 @@
+import pytest
+
+from einstein_wtn import replay, runner
+from einstein_wtn.agents import HeuristicAgent, RandomAgent
+from einstein_wtn.types import Player
+
+
+def test_parallel_match_reports_every_game_until_decided(capsys):
+    runner.play_match(
+        red_agent=HeuristicAgent(seed=1),
+        blue_agent=RandomAgent(seed=2),
+        seed=5,
+        time_limit_seconds=None,
+        verbose=False,
+        show_stats=False,
+        red_order=None,
+        blue_order=None,
+        workers=2,
+    )
+
+    lines = capsys.readouterr().out.splitlines()
+    results = [line for line in lines if line.startswith("Result:")]
+    assert 4 <= len(results) <= 7
+    assert "(score 4-" in results[-1] or results[-1].endswith("-4)")
+    assert lines[-1].startswith("Match winner:")
+
+
+def test_saved_wtn_replays_to_same_winner(tmp_path):
+    path = tmp_path / "game.wtn.txt"
+    summary = runner.play_game(
+        red_agent=HeuristicAgent(seed=3),
+        blue_agent=RandomAgent(seed=4),
+        first=Player.BLUE,
+        seed=11,
+        time_limit_seconds=None,
+        emit_moves=False,
+        show_board=False,
+        show_stats=False,
+        collect_stats=False,
+        red_order=None,
+        blue_order=None,
+        save_wtn_path=str(path),
+    )
+
+    _, winner = replay.replay_file(str(path))
+    assert winner == summary.winner
+    assert f"# turns={summary.turns}" in path.read_text(encoding="utf-8")
+
+
+def test_parse_layout_string_rejects_non_permutations():
+    assert runner.parse_layout_string("6, 5, 4, 3, 2, 1") == [6, 5, 4, 3, 2, 1]
+    for raw in ("1,2,3,4,5", "1,1,2,3,4,5", "0,1,2,3,4,5", "1,2,3,4,5,7", "-1,2,3,4,5,6"):
+        with pytest.raises(ValueError):
+            runner.parse_layout_string(raw)
+
+
+def test_failed_game_leaves_no_wtn_file(tmp_path):
+    class FailingAgent(RandomAgent):
+        def choose_move(self, state, dice, time_budget_ms=None):
+            raise RuntimeError("boom")
+
+    path = tmp_path / "game.wtn.txt"
+    try:
+        runner.play_game(
+            red_agent=FailingAgent(seed=1),
+            blue_agent=FailingAgent(seed=2),
+            first=Player.RED,
+            seed=0,
+            time_limit_seconds=None,
+            emit_moves=False,
+            show_board=False,
+            show_stats=False,
+            collect_stats=False,
+            red_order=None,
+            blue_order=None,
+            save_wtn_path=str(path),
+        )
+    except RuntimeError:
+        pass
+    else:
+        assert False, "Expected the agent error to propagate"
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_buffered_output_matches_live_output(capsys):
+    outputs = []
+    for buffer_output in (False, True):
+        runner.play_game(
+            red_agent=HeuristicAgent(seed=5),
+            blue_agent=RandomAgent(seed=6),
+            first=Player.RED,
+            seed=7,
+            time_limit_seconds=None,
+            emit_moves=True,
+            show_board=True,
+            show_stats=False,
+            collect_stats=False,
+            red_order=None,
+            blue_order=None,
+            buffer_output=buffer_output,
+        )
+        outputs.append(capsys.readouterr().out)
+
+    assert outputs[0] == outputs[1]
+    assert outputs[0].startswith("Turn 1:")
+
+
+def test_main_closes_root_pools_on_error(monkeypatch):
+    from einstein_wtn.agents import ExpectiminimaxAgent
+
+    closed = []
+    monkeypatch.setattr(ExpectiminimaxAgent, "close_root_pool", lambda self: closed.append(self))
+
+    def failing_game(**kwargs):
+        raise ValueError("bad game")
+
+    monkeypatch.setattr(runner, "play_game", failing_game)
+    try:
+        runner.main(["--mode", "game", "--red", "expecti", "--blue", "opening-expecti", "--parallel-root", "2"])
+    except SystemExit:
+        pass
+    else:
+        assert False, "Expected SystemExit for the failed game"
+    assert len(closed) == 2
@@ -1,7 +1,7 @@
 import time
 
 from einstein_wtn import engine
-from einstein_wtn.time_manager import TimeManagerConfig, compute_move_budget_ms
+from einstein_wtn.time_manager import TimeManagerConfig, compute_move_budget, compute_move_budget_ms
 from einstein_wtn.types import GameState, Player
 
 
@@ -67,3 +67,30 @@ def test_budget_endgame_multiplier():
     endgame_budget = compute_move_budget_ms(state_endgame, dice=1, remaining_ms=8_000, agent_name="expecti", cfg=cfg)
 
     assert endgame_budget > normal
+
+
+def test_budget_struct_matches_ms_wrapper():
+    cfg = TimeManagerConfig()
+    winning_state = make_state({1: (3, 3)}, {1: (4, 4)}, Player.RED)
+
+    budget = compute_move_budget(winning_state, dice=1, remaining_ms=10_000, agent_name="expecti", cfg=cfg)
+
+    assert budget.budget_ms == compute_move_budget_ms(
+        winning_state, dice=1, remaining_ms=10_000, agent_name="expecti", cfg=cfg
+    )
+    assert compute_move_budget_ms.last_budget == budget
+    assert "WIN" in budget.flags
+    assert budget.baseline_ms == 10_000 * cfg.base_frac
+
+
+def test_budget_repeated_position_returns_fresh_flags():
+    cfg = TimeManagerConfig()
+    state = make_state({1: (3, 3)}, {1: (4, 4)}, Player.RED)
+
+    first = compute_move_budget(state, dice=1, remaining_ms=10_000, agent_name="expecti", cfg=cfg)
+    first.flags.append("MUTATED")
+    second = compute_move_budget(state, dice=1, remaining_ms=5_000, agent_name="expecti", cfg=cfg)
+
+    assert "MUTATED" not in second.flags
+    assert "WIN" in second.flags
+    assert second.baseline_ms == 5_000 * cfg.base_frac
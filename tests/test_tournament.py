@@ -21,3 +21,18 @@ def test_tournament_smoke():
     assert result.avg_turns > 0
     assert Player.RED in result.avg_move_time_ms and Player.BLUE in result.avg_move_time_ms
     assert result.side_stats[Player.RED].samples >= 0
+
+
+def test_tournament_parallel_workers():
+    result = tournament.run_tournament(
+        red_agent=HeuristicAgent(seed=1),
+        blue_agent=HeuristicAgent(seed=2),
+        games=4,
+        seed=0,
+        time_limit_seconds=None,
+        workers=2,
+    )
+
+    assert result.games == 4
+    assert result.red_wins + result.blue_wins == 4
+    assert result.avg_turns > 0
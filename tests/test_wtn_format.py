@@ -1,6 +1,6 @@
 import textwrap
 
-from einstein_wtn.wtn_format import dump_wtn, parse_wtn, rc_to_sq, sq_to_rc
+from einstein_wtn.wtn_format import dump_wtn, format_board, parse_wtn, rc_to_sq, sq_to_rc
 
 
 def test_coord_roundtrip():
@@ -28,3 +28,12 @@ def test_parse_and_dump_roundtrip():
     assert reparsed.red_layout == game.red_layout
     assert reparsed.blue_layout == game.blue_layout
     assert reparsed.moves == game.moves
+
+
+def test_format_board_renders_pieces_and_empties():
+    board = [[0] * 5 for _ in range(5)]
+    board[0][0] = 3
+    board[4][4] = -5
+    lines = format_board(board).splitlines()
+    assert lines[0] == "R3  .   .   .   . "
+    assert lines[4] == " .   .   .   .  B5"